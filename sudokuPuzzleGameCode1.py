@@ -1,11 +1,16 @@
-import random
 import time
 import json
-import psutil
 import tkinter as tk
 from tkinter import ttk, messagebox, font
 from typing import List, Tuple, Optional
 import threading
+import os
+import sys
+import tempfile
+
+from sudoku_engine import (BOX_SIZES, CELL_CHARS, RESUMABLE, ConflictIndex, SudokuBoard, SolverControl, PuzzlePool,
+                           StatsChannel,
+                           flatten_board, unflatten_board, read_checkpoint, solve)
 
 # Define color scheme - UNCHANGED
 COLORS = {
@@ -25,12 +30,235 @@ COLORS = {
     "invalid": "#E74C3C",  #invalid cell color
 }
 
+#algorithm radio buttons: (engine algorithm name, label, short description)
+ALGORITHM_OPTIONS = [
+    ("genetic", "Genetic Algorithm", "Evolves a population of solutions\nover generations"),
+    ("backtracking", "Backtracking", "Systematically tries values and\nbacktracks when needed"),
+    ("bitmask", "Backtracking (bitmask)", "Same search, but tracks used digits\nwith row/column/box bitmasks"),
+    ("mrv", "Backtracking (MRV)", "Fills the most constrained cell first\nand prunes dead ends early"),
+    ("dlx", "Dancing Links", "Exact-cover search (Algorithm X)\nover cell/row/column/box constraints"),
+    ("permutation", "Genetic (row permutations)", "Rows stay valid permutations;\nonly columns and boxes evolve"),
+    ("islands", "Genetic (island model)", "One population per CPU core,\nswapping their best boards"),
+    ("hybrid", "Hybrid (GA + MRV)", "Evolves until it stalls, then exact\nsearch repairs the conflicted cells"),
+]
+
+#algorithms that report a fitness and always return their best board
+GENETIC_ALGORITHMS = {"genetic", "permutation", "islands", "hybrid"}
+
+#how often the UI picks up the solver's latest stats (about 30 frames a second)
+FRAME_INTERVAL_MS = 33
+
+class EntryBoard:
+    """Draws the board as one Frame + Entry widget per cell, all rebuilt for every new game"""
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.parent = parent
+        self.entries = []
+        self.drawn = []  #what each cell shows right now: (text, background, is it an original number)
+
+    def build(self, size, box_rows, box_cols, cell_size, font_size):
+        # Clear existing cells
+        for widget in self.parent.winfo_children():
+            widget.destroy()
+        
+        self.entries = []
+        #fresh widgets have drawn nothing yet
+        self.drawn = [[None] * size for _ in range(size)]
+        
+        for i in range(size):
+            row_entries = []
+            for j in range(size):
+                
+                box_row, box_col = i // box_rows, j // box_cols 
+                is_even_box = (box_row + box_col) % 2 == 0
+                bg_color = COLORS["bg_light"] if is_even_box else COLORS["bg_medium"]
+                
+                cell_frame = tk.Frame(self.parent, 
+                                     width=cell_size, 
+                                     height=cell_size, 
+                                     bg=bg_color, 
+                                     highlightbackground=COLORS["bg_dark"],
+                                     highlightthickness=1)
+                
+               
+                cell_frame.grid(row=i, column=j)
+                cell_frame.grid_propagate(False)  # Keep cell size fixed
+                
+               
+                if i % box_rows == 0 and i > 0:
+                    cell_frame.grid(row=i, column=j, pady=(3, 0))
+                if j % box_cols == 0 and j > 0:
+                    cell_frame.grid(row=i, column=j, padx=(3, 0))
+                
+               
+                cell_entry = tk.Entry(cell_frame, 
+                                     width=2,
+                                     font=("Arial", font_size, "bold"),
+                                     bg=bg_color,
+                                     fg=COLORS["text_light"],
+                                     bd=0,
+                                     justify=tk.CENTER, 
+                                     insertbackground=COLORS["user_cell"],  
+                                     disabledbackground=bg_color,
+                                     disabledforeground=COLORS["original_cell"])
+                cell_entry.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+                
+            
+                cell_frame.bind("<Button-1>", lambda event, r=i, c=j: self.app.select_cell(r, c))
+                cell_entry.bind("<FocusIn>", lambda event, r=i, c=j: self.app.select_cell(r, c))
+                cell_entry.bind("<KeyPress>", lambda event, r=i, c=j: self.app.handle_key_press(event, r, c))
+                
+                row_entries.append(cell_entry)
+            self.entries.append(row_entries)
+
+    def draw(self, i, j, look):
+        #bring one cell up to date, touching only what changed since it was last drawn
+        drawn = self.drawn[i][j]
+        if look == drawn:
+            return
+        text, bg_color, original = look
+        old_text, old_bg, old_original = drawn or (None, None, None)
+        cell_entry = self.entries[i][j]
+        
+        #put the number inside the box, or leave empty if it's 0 (a disabled entry can't be edited)
+        if text != old_text:
+            cell_entry.configure(state="normal")
+            cell_entry.delete(0, tk.END)
+            if text:
+                cell_entry.insert(0, text)
+            old_original = None  #the state has to be set again below
+        
+        #set the text color and state based on whether it's an original number or a number typed by tthe user
+        if original != old_original:
+            if original:
+                cell_entry.configure(fg=COLORS["original_cell"], state="disabled")
+            else:
+                cell_entry.configure(fg=COLORS["user_cell"], state="normal")
+        
+        if bg_color != old_bg:
+            cell_entry.configure(bg=bg_color)
+        
+        self.drawn[i][j] = look
+
+    def focus(self, i, j):
+        self.entries[i][j].focus_set()
+
+
+class CanvasBoard:
+    """Draws the whole board on a single Canvas, with a rectangle and a text item per cell.
+
+    Clicks and keys are bound once on the canvas and mapped to a cell from the
+    pointer position. Items are built once per board layout and kept: a new game
+    of the same size just redraws the cells that differ, and switching back to
+    a size used before only hides one set of items and shows another, so no
+    widgets or bindings are ever created per cell.
+    """
+
+    GAP = 3  #pixels between boxes, like the padding of the entry grid
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.canvas = tk.Canvas(parent, bg=COLORS["bg_medium"], bd=0, highlightthickness=0, takefocus=1)
+        self.canvas.pack()
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<KeyPress>", self.on_key)
+        self.layouts = {}  #(size, box rows, box cols) -> the items and drawn state for that layout
+        self.layout = None
+
+    def build(self, size, box_rows, box_cols, cell_size, font_size):
+        layout = (size, box_rows, box_cols)
+        if layout == self.layout:
+            return
+        if self.layout is not None:
+            self.canvas.itemconfigure(self.tag, state="hidden")
+        self.layout = layout
+        self.size, self.box_rows, self.box_cols = layout
+        self.cell_size = cell_size
+        self.tag = "board{}x{}x{}".format(*layout)
+        
+        if layout in self.layouts:
+            self.canvas.itemconfigure(self.tag, state="normal")
+        else:
+            self.layouts[layout] = self.create_items(font_size)
+        self.rects, self.texts, self.drawn = self.layouts[layout]
+        
+        extent_x = self.offset(size - 1, box_cols) + cell_size
+        extent_y = self.offset(size - 1, box_rows) + cell_size
+        self.canvas.configure(width=extent_x, height=extent_y)
+
+    def create_items(self, font_size):
+        #one rectangle and one (empty) text item per cell, row by row
+        size, cell_size = self.size, self.cell_size
+        font = ("Arial", font_size, "bold")
+        rects, texts = [], []
+        for i in range(size):
+            y = self.offset(i, self.box_rows)
+            for j in range(size):
+                x = self.offset(j, self.box_cols)
+                rects.append(self.canvas.create_rectangle(x, y, x + cell_size - 1, y + cell_size - 1,
+                                                          outline=COLORS["bg_dark"], tags=self.tag))
+                texts.append(self.canvas.create_text(x + cell_size / 2, y + cell_size / 2, text="",
+                                                     font=font, tags=self.tag))
+        return rects, texts, [None] * (size * size)
+
+    def offset(self, index, box):
+        #pixel position of row/column 'index', counting the gaps between boxes
+        return index * self.cell_size + index // box * self.GAP
+
+    def index_at(self, position, box):
+        #the row/column under a pixel position, or None on a gap between boxes
+        box_span = box * self.cell_size
+        box_index, within = divmod(int(position), box_span + self.GAP)
+        if position < 0 or within >= box_span:
+            return None
+        index = box_index * box + within // self.cell_size
+        return index if index < self.size else None
+
+    def cell_at(self, x, y):
+        row, col = self.index_at(y, self.box_rows), self.index_at(x, self.box_cols)
+        return None if row is None or col is None else (row, col)
+
+    def on_click(self, event):
+        cell = self.cell_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if cell is not None:
+            self.app.select_cell(*cell)
+
+    def on_key(self, event):
+        if self.app.selected_cell != (-1, -1):
+            return self.app.handle_key_press(event, *self.app.selected_cell)
+
+    def draw(self, i, j, look):
+        #bring one cell up to date, touching only what changed since it was last drawn
+        index = i * self.size + j
+        drawn = self.drawn[index]
+        if look == drawn:
+            return
+        text, bg_color, original = look
+        old_text, old_bg, old_original = drawn or (None, None, None)
+        if text != old_text or original != old_original:
+            #original numbers can't be selected, so there is no state to set, only the colour
+            self.canvas.itemconfigure(self.texts[index], text=text,
+                                      fill=COLORS["original_cell"] if original else COLORS["user_cell"])
+        if bg_color != old_bg:
+            self.canvas.itemconfigure(self.rects[index], fill=bg_color)
+        self.drawn[index] = look
+
+    def focus(self, i, j):
+        self.canvas.focus_set()
+
+
+#board renderers; "entry" is the classic one-widget-per-cell grid
+BOARD_RENDERERS = {"canvas": CanvasBoard, "entry": EntryBoard}
+
+
 class SudokuSolver:
   
     #integrated sudoku solver application with GUI interface which ccombines genetic and backtracking algorithms with an interactive interface/GUI.
    
-    def __init__(self, root):
+    def __init__(self, root, renderer="canvas"):
         self.root = root
+        self.renderer = renderer  #which of BOARD_RENDERERS draws the board
         self.root.title("Sudoku Solver")
         self.root.configure(bg=COLORS["bg_dark"])
         
@@ -43,6 +271,12 @@ class SudokuSolver:
         self.algorithm = "genetic"  #default algorithm to be selected when we first run the code
         self.solving = False
         self.solver_thread = None
+        self.solver_control = None  #lets us stop the engine's solver from the UI
+        self.stats_channel = None  #the running solver's latest stats and, at the end, its result
+        #a stopped run saves its progress here so the next Solve can pick it up
+        #(one file per window, so two windows never pick up each other's runs)
+        self.checkpoint_path = os.path.join(tempfile.gettempdir(), f"sudoku_checkpoint_{os.getpid()}.json.gz")
+        self.resume_checkpoint = None
         
         #game state
         self.current_board = []
@@ -50,9 +284,14 @@ class SudokuSolver:
         self.flattened_board = ""
         self.selected_cell = (-1, -1)
         
-        #tracking any invalid cells for highlighting
+        #tracking any invalid cells for highlighting (kept up to date by the conflict index)
+        self.conflict_index = None
         self.invalid_cells = set()
         
+        #cells the board view still has to redraw
+        self.dirty_cells = set()  #cells waiting for the batched redraw (None = all of them)
+        self.redraw_pending = False
+        
         #solving statistics
         self.iterations = 0
         self.elapsed_time = 0.0
@@ -60,9 +299,14 @@ class SudokuSolver:
         self.fitness = 0
         self.start_time = 0  #this tracks when the solving starts
         
+        #puzzles are generated in the background so new games appear instantly
+        self.puzzle_pool = PuzzlePool()
+        self.waiting_for_puzzle = None  #after() id while a new game waits for its puzzle
+        
     
         self.create_ui() #create UI componenets
         self.new_game() #genearting a new game when we first run the code
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         self.update_stats_display()
     
@@ -129,7 +373,7 @@ class SudokuSolver:
         size_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.size_var = tk.StringVar(value="9×9")
-        size_options = ["3×3", "6×6", "9×9"]
+        size_options = [f"{size}×{size}" for size in BOX_SIZES]
         size_dropdown = ttk.Combobox(size_frame, textvariable=self.size_var, 
                                     values=size_options, width=5, style="TCombobox")
         size_dropdown.pack(side=tk.LEFT)
@@ -142,14 +386,15 @@ class SudokuSolver:
         
         self.game_frame = tk.Frame(board_container, bg=COLORS["bg_medium"], bd=2)
         self.game_frame.pack(padx=5, pady=5)
+        self.board_view = BOARD_RENDERERS[self.renderer](self, self.game_frame)
         
         #this is the number buttons frame 
         num_buttons_frame = tk.Frame(left_panel, bg=COLORS["bg_dark"])
         num_buttons_frame.pack(pady=15)
         
-        #creating the number buttons
+        #creating the number buttons (one per digit of the biggest board)
         self.num_buttons = []
-        for i in range(1, 10):
+        for i in range(1, max(BOX_SIZES) + 1):
             btn = tk.Button(num_buttons_frame, text=str(i), width=3, height=1,
                            font=("Arial", 14, "bold"),
                            bg=COLORS["bg_medium"],
@@ -163,7 +408,7 @@ class SudokuSolver:
             self.num_buttons.append(btn)
         
         #adding the clear button
-        clear_btn = tk.Button(num_buttons_frame, text="Clear", width=7, height=1,
+        self.clear_btn = tk.Button(num_buttons_frame, text="Clear", width=7, height=1,
                              font=("Arial", 12),
                              bg=COLORS["bg_light"],
                              fg=COLORS["text_light"],
@@ -172,7 +417,7 @@ class SudokuSolver:
                              relief=tk.RAISED,
                              bd=0,
                              command=lambda: self.set_number(0))
-        clear_btn.grid(row=1, column=4, padx=5, pady=5)
+        self.clear_btn.grid(row=1, column=4, padx=5, pady=5)
         
         #for the control buttons frame
         control_frame = tk.Frame(left_panel, bg=COLORS["bg_dark"])
@@ -190,6 +435,19 @@ class SudokuSolver:
                                   command=self.solve_puzzle)
         self.solve_btn.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
         
+        #the stop button halts the solver but keeps the board, so the run can be continued
+        self.stop_btn = tk.Button(control_frame, text="STOP", width=10, height=2,
+                                 font=("Arial", 12),
+                                 bg=COLORS["bg_medium"],
+                                 fg=COLORS["text_light"],
+                                 activebackground=COLORS["accent"],
+                                 activeforeground=COLORS["text_light"],
+                                 relief=tk.RAISED,
+                                 bd=0,
+                                 state=tk.DISABLED,
+                                 command=self.pause_solving)
+        self.stop_btn.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        
         #creating the new game button
         new_game_btn = tk.Button(control_frame, text="NEW GAME", width=10, height=2,
                                 font=("Arial", 12),
@@ -224,43 +482,25 @@ class SudokuSolver:
         
         #make the algortim radio buttons
         self.algo_var = tk.StringVar(value="genetic")
-        genetic_radio = tk.Radiobutton(algo_frame, text="Genetic Algorithm", 
-                                      variable=self.algo_var,
-                                      value="genetic", 
-                                      bg=COLORS["bg_medium"], 
-                                      fg=COLORS["text_light"],
-                                      selectcolor=COLORS["bg_dark"],
-                                      activebackground=COLORS["bg_medium"],
-                                      activeforeground=COLORS["accent"],
-                                      font=("Arial", 10))
-        genetic_radio.pack(anchor=tk.W, pady=(5, 0))
-        
-        genetic_desc = tk.Label(algo_frame, 
-                               text="Evolves a population of solutions\nover generations", 
-                               bg=COLORS["bg_medium"], 
-                               fg=COLORS["text_light"],
-                               font=("Arial", 8), 
-                               justify=tk.LEFT)
-        genetic_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
-        
-        backtrack_radio = tk.Radiobutton(algo_frame, text="Backtracking", 
-                                        variable=self.algo_var,
-                                        value="backtracking", 
-                                        bg=COLORS["bg_medium"], 
-                                        fg=COLORS["text_light"],
-                                        selectcolor=COLORS["bg_dark"],
-                                        activebackground=COLORS["bg_medium"],
-                                        activeforeground=COLORS["accent"],
-                                        font=("Arial", 10))
-        backtrack_radio.pack(anchor=tk.W, pady=(5, 0))
-        
-        backtrack_desc = tk.Label(algo_frame, 
-                                 text="Systematically tries values and\nbacktracks when needed", 
-                                 bg=COLORS["bg_medium"], 
-                                 fg=COLORS["text_light"],
-                                 font=("Arial", 8), 
-                                 justify=tk.LEFT)
-        backtrack_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
+        for value, text, description in ALGORITHM_OPTIONS:
+            algo_radio = tk.Radiobutton(algo_frame, text=text, 
+                                       variable=self.algo_var,
+                                       value=value, 
+                                       bg=COLORS["bg_medium"], 
+                                       fg=COLORS["text_light"],
+                                       selectcolor=COLORS["bg_dark"],
+                                       activebackground=COLORS["bg_medium"],
+                                       activeforeground=COLORS["accent"],
+                                       font=("Arial", 10))
+            algo_radio.pack(anchor=tk.W, pady=(5, 0))
+            
+            algo_desc = tk.Label(algo_frame, 
+                                text=description, 
+                                bg=COLORS["bg_medium"], 
+                                fg=COLORS["text_light"],
+                                font=("Arial", 8), 
+                                justify=tk.LEFT)
+            algo_desc.pack(anchor=tk.W, padx=20, pady=(0, 5))
 
         
         #statistics frame
@@ -345,65 +585,19 @@ class SudokuSolver:
  
     def create_board_ui(self):
         #create the Sudoku board UI based on current size
-        # Clear existing cells
-        for widget in self.game_frame.winfo_children():
-            widget.destroy()
-        
         #calculate cell size based on board size
-        cell_size = 50 if self.size <= 6 else 40
-        
-        #create cells
-        self.cells = []
-        self.cell_entries = []
+        if self.size <= 6:
+            cell_size, font_size = 50, 16
+        elif self.size <= 9:
+            cell_size, font_size = 40, 14
+        elif self.size <= 16:
+            cell_size, font_size = 32, 11
+        else:
+            cell_size, font_size = 24, 9
         
-        for i in range(self.size):
-            row_cells = []
-            row_entries = []
-            for j in range(self.size):
-                
-                box_row, box_col = i // self.box_size_rows, j // self.box_size_cols 
-                is_even_box = (box_row + box_col) % 2 == 0
-                bg_color = COLORS["bg_light"] if is_even_box else COLORS["bg_medium"]
-                
-                cell_frame = tk.Frame(self.game_frame, 
-                                     width=cell_size, 
-                                     height=cell_size, 
-                                     bg=bg_color, 
-                                     highlightbackground=COLORS["bg_dark"],
-                                     highlightthickness=1)
-                
-               
-                cell_frame.grid(row=i, column=j)
-                cell_frame.grid_propagate(False)  # Keep cell size fixed
-                
-               
-                if i % self.box_size_rows == 0 and i > 0:
-                    cell_frame.grid(row=i, column=j, pady=(3, 0))
-                if j % self.box_size_cols == 0 and j > 0:
-                    cell_frame.grid(row=i, column=j, padx=(3, 0))
-                
-               
-                cell_entry = tk.Entry(cell_frame, 
-                                     width=2,
-                                     font=("Arial", 16 if self.size <= 6 else 14, "bold"),
-                                     bg=bg_color,
-                                     fg=COLORS["text_light"],
-                                     bd=0,
-                                     justify=tk.CENTER, 
-                                     insertbackground=COLORS["user_cell"],  
-                                     disabledbackground=bg_color,
-                                     disabledforeground=COLORS["original_cell"])
-                cell_entry.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-                
-            
-                cell_frame.bind("<Button-1>", lambda event, r=i, c=j: self.select_cell(r, c))
-                cell_entry.bind("<FocusIn>", lambda event, r=i, c=j: self.select_cell(r, c))
-                cell_entry.bind("<KeyPress>", lambda event, r=i, c=j: self.handle_key_press(event, r, c))
-                
-                row_cells.append(cell_entry)  
-                row_entries.append(cell_entry)
-            self.cells.append(row_cells)
-            self.cell_entries.append(row_entries)
+        #create cells (any old dirty cells belong to the old board)
+        self.board_view.build(self.size, self.box_size_rows, self.box_size_cols, cell_size, font_size)
+        self.dirty_cells = set()
         
         #updating the number buttons based on board size (like 3x3, 6x6, or 9x9)
         for i, btn in enumerate(self.num_buttons):
@@ -411,12 +605,22 @@ class SudokuSolver:
                 btn.grid()
             else:
                 btn.grid_remove()
+        
+        #the clear button sits in the slot after the last number
+        self.clear_btn.grid(row=self.size // 5, column=self.size % 5)
     
     def handle_key_press(self, event, row, col):
         """Handle key press in a cell"""
-        if event.char.isdigit() and 0 <= int(event.char) <= self.size:
-            #if it is a valid digit input  then we set the number
-            self.set_number(int(event.char))
+        char = event.char.upper()
+        if char and char in CELL_CHARS[:self.size + 1]:
+            #a valid digit (or base-36 letter, A=10) so we set the number
+            num = CELL_CHARS.index(char)
+            
+            #on boards bigger than 9×9 a second digit extends the first one (1 then 6 = 16)
+            current = self.current_board[row][col]
+            if char.isdigit() and self.size > 9 and 1 <= current <= 9 and current * 10 + num <= self.size:
+                num = current * 10 + num
+            self.set_number(num)
             return "break"  # Prevent default behavior
         elif event.keysym == "BackSpace":
             #backspace to be able to clear the cell
@@ -424,37 +628,49 @@ class SudokuSolver:
             return "break"  #prevent default behavior
         else:
             # if the input is invalid thrn show an error message
-            self.status_var.set(f"Invalid input! Only numbers 0-{self.size} are allowed.")
+            if self.size > 9:
+                self.status_var.set(f"Invalid input! Only numbers 0-{self.size} (or letters A-{CELL_CHARS[self.size]}) are allowed.")
+            else:
+                self.status_var.set(f"Invalid input! Only numbers 0-{self.size} are allowed.")
             return "break"  #this si to prevent any non-digit input
     
     
     def change_board_size(self, event=None):
         """Handle board size change"""
         size_str = self.size_var.get()
-        if size_str == "3×3":
-            self.size = 3
-            self.box_size_rows = 1  # 1×1 boxes for 3×3
-            self.box_size_cols = 1
-        elif size_str == "6×6":
-            self.size = 6
-            self.box_size_rows = 2  # 2×3 boxes for 6×6
-            self.box_size_cols = 3
-        else:  # 9×9
-            self.size = 9
-            self.box_size_rows = 3  # 3×3 boxes for 9×9
-            self.box_size_cols = 3
-        
-        #reset game with new size
-        self.new_game()
+        size = int(size_str.split("×")[0])
+        
+        #reset game with new size (BOX_SIZES gives e.g. 2×3 boxes for 6×6)
+        self.new_game((size,) + BOX_SIZES[size])
 
    
-    def new_game(self):
+    def new_game(self, layout=None):
        #### """Generate a new Sudoku puzzle"""
-        #stop any ongoing solving
-        self.stop_solving()
+        #layout is (size, box rows, box cols); by default the current one
+        layout = layout or (self.size, self.box_size_rows, self.box_size_cols)
+        
+        #a newer request replaces one still waiting for its puzzle
+        if self.waiting_for_puzzle is not None:
+            self.root.after_cancel(self.waiting_for_puzzle)
+            self.waiting_for_puzzle = None
+        
+        #generate a new puzzle; a big board may still be in the making, so keep
+        #the current game on screen (a running solve carries on, but no new one
+        #can start) and check again shortly instead of blocking. The pool has to
+        #run for that, even if the solve's timing suffers
+        generated = self.generate_puzzle(layout)
+        if generated is None:
+            self.status_var.set(f"Generating a {layout[0]}×{layout[0]} puzzle...")
+            self.solve_btn.configure(state=tk.DISABLED)
+            self.puzzle_pool.resume()
+            self.waiting_for_puzzle = self.root.after(200, lambda: self.new_game(layout))
+            return
+        puzzle, solution = generated
         
-        #generate a new puzzle
-        puzzle, solution = self.generate_puzzle()
+        #stop any ongoing solving, and ignore whatever it still reports
+        self.stop_solving()
+        self.stats_channel = None
+        self.size, self.box_size_rows, self.box_size_cols = layout
         
         # Store the boards
         self.current_board = [row[:] for row in puzzle]
@@ -470,7 +686,7 @@ class SudokuSolver:
         self.selected_cell = (-1, -1)
         
         #reset invalid cells
-        self.invalid_cells = set()
+        self.reset_conflicts()
         
         #reset statistics (FULL RESET)
         self.iterations = 0
@@ -496,110 +712,43 @@ class SudokuSolver:
         #forcing the GUI t0 refresh immediately
         self.root.update()
 
-    def generate_puzzle(self):
-       ## Generate a Sudoku puzzle of the current size
-        #create empty board
-        board = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        
-        #filling diagonal boxes first (these can be filled independently)
-        for i in range(0, self.size, max(self.box_size_rows, self.box_size_cols)):
-            if i + self.box_size_rows <= self.size and i + self.box_size_cols <= self.size:
-                self.fill_box(board, i, i)
-        
-        #fill the rest using backtracking
-        self.solve_board(board)
-        
-        #then create a copy for the solution
-        solution = [row[:] for row in board]
-        
-        #and remove some numbers to create the puzzle
-        cells_to_remove = int(self.size * self.size * 0.6)  #her we are rwemoving about 60% of cells
-        
-        #then get all cell positions and shuffle them
-        positions = [(i, j) for i in range(self.size) for j in range(self.size)]
-        random.shuffle(positions)
-        
-        for i in range(min(cells_to_remove, len(positions))):
-            row, col = positions[i]
-            board[row][col] = 0
-        
-        return board, solution
-    
-    def fill_box(self, board, start_row, start_col):
-        """Fill a box with random numbers"""
-        nums = list(range(1, self.size + 1))
-        random.shuffle(nums)
-        
-        for i in range(self.box_size_rows):
-            for j in range(self.box_size_cols):
-                if start_row + i < self.size and start_col + j < self.size:
-                    board[start_row + i][start_col + j] = nums.pop()
-    
-    def is_valid_placement(self, board, row, col, num):
-        """Check if placing 'num' at position (row, col) is valid"""
-        for x in range(self.size):
-            if board[row][x] == num:
-                return False
-        
-        for x in range(self.size):
-            if board[x][col] == num:
-                return False
-        
-        box_row, box_col = row - row % self.box_size_rows, col - col % self.box_size_cols
-        for i in range(self.box_size_rows):
-            for j in range(self.box_size_cols):
-                if box_row + i < self.size and box_col + j < self.size:
-                    if board[box_row + i][box_col + j] == num:
-                        return False
-        
-        return True
+    def generate_puzzle(self, layout):
+       ## take a ready-made puzzle of this layout from the pool (None if there isn't one yet)
+        generated = self.puzzle_pool.take(*layout, wait=False)
+        if generated is None:
+            return None
+        puzzle, solution = generated
+        return puzzle.to_list(), solution.to_list()
     
-    def solve_board(self, board):
-       #### Solve the board using backtracking
-        for row in range(self.size):
-            for col in range(self.size):
-                if board[row][col] == 0:
-                    for num in range(1, self.size + 1):
-                        if self.is_valid_placement(board, row, col, num):
-                            board[row][col] = num
-                            
-                            if self.solve_board(board):
-                                return True
-                            
-                            board[row][col] = 0
-                    
-                    return False
-        
-        return True
+    def reset_conflicts(self):
+        #rebuild the conflict index after the whole board changed;
+        #invalid_cells is the index's own live set, so edits keep it exact
+        self.conflict_index = ConflictIndex(self.make_board(self.current_board))
+        self.invalid_cells = self.conflict_index.conflicts
+
+    def make_board(self, cells):
+        #pack a list-of-lists board into the engine's compact board
+        return SudokuBoard(self.size, self.box_size_rows, self.box_size_cols, cells)
     
     def flatten_board(self, board):
         #convert 2D board to a flattened string
-        return ''.join(str(cell) for row in board for cell in row)
+        return flatten_board(board)
     
     def unflatten_board(self, flattened, size):
         #then convert the flattened string back to a 2D board
-        board = []
-        for i in range(0, len(flattened), size):
-            board.append([int(flattened[i+j]) for j in range(size)])
-        return board
+        return unflatten_board(flattened, size)
     
     def select_cell(self, row, col):
         # this part is for handling cell cselection 
         if not self.solving and self.original_board[row][col] == 0:
-            #deselect previous cell
+            #deselect previous cell and select the new one, redrawing just those two
+            dirty = {(row, col)}
             if self.selected_cell != (-1, -1):
-                prev_row, prev_col = self.selected_cell
-                box_row, box_col = prev_row // self.box_size_rows, prev_col // self.box_size_cols
-                is_even_box = (box_row + box_col) % 2 == 0
-                bg_color = COLORS["bg_light"] if is_even_box else COLORS["bg_medium"]
-                
-                self.cell_entries[prev_row][prev_col].configure(bg=bg_color)
-            
-            # Select new cell
+                dirty.add(self.selected_cell)
             self.selected_cell = (row, col)
+            self.request_redraw(dirty)
             
-            self.cell_entries[row][col].configure(bg=COLORS["selected"])
-            self.cell_entries[row][col].focus_set() 
+            self.board_view.focus(row, col)
     
     def set_number(self, num):
         ##set the number in the selected cell
@@ -610,22 +759,20 @@ class SudokuSolver:
             if self.original_board[row][col] == 0:
                 #toggle the number if it's already there
                 if self.current_board[row][col] == num:
-                    self.current_board[row][col] = 0
-                    
-                    #removing from invalid cells if it was there
-                    if (row, col) in self.invalid_cells:
-                        self.invalid_cells.remove((row, col))
-                else:
-                    self.current_board[row][col] = num
-                    
+                    num = 0
+                self.current_board[row][col] = num
+                
+                #the conflict index updates only this cell and its peers
+                changed = self.conflict_index.set(row, col, num)
+                if num:
                     #then chexking if this placement is valid
                     self.validate_cell(row, col)
                 
-                #updating the the display
-                self.update_board_display()
+                #updating the the display (only the cells that changed)
+                self.request_redraw(changed)
                 
                 #keep the focus on the current cell after setting number
-                self.cell_entries[row][col].focus_set()
+                self.board_view.focus(row, col)
     
     def validate_cell(self, row, col):
      #  here we are checking  if the number in the cell is valid according to Sudoku rules  row, col)
@@ -633,28 +780,16 @@ class SudokuSolver:
         
         #skip empty cells
         if num == 0:
-            if (row, col) in self.invalid_cells:
-                self.invalid_cells.remove((row, col))
             return True
         
-        #then create a temporary board without the current number to check against
-        temp_board = [r[:] for r in self.current_board]
-        temp_board[row][col] = 0
+        #the conflict index already knows, no need to rescan the board
+        is_valid = (row, col) not in self.invalid_cells
         
-        #aand check if the placement is valid
-        is_valid = self.is_valid_placement(temp_board, row, col, num)
-        
-        #and update invalid cells set
         if not is_valid:
-            self.invalid_cells.add((row, col))
             self.status_var.set("Invalid move! Check highlighted cells.")
-        else:
-            if (row, col) in self.invalid_cells:
-                self.invalid_cells.remove((row, col))
-            
-            #check if there are still any invalid cells
-            if not self.invalid_cells:
-                self.status_var.set("Valid move!")
+        elif not self.invalid_cells:
+            #no invalid cells left anywhere
+            self.status_var.set("Valid move!")
         
         return is_valid 
        
@@ -662,11 +797,9 @@ class SudokuSolver:
     def check_solution(self):
         #check if the current board state is valid and complete
         #first we check if the board is complete (like no empty cells)
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.current_board[i][j] == 0:
-                    messagebox.showinfo("Incomplete", "The puzzle is not complete yet!")
-                    return
+        if not self.conflict_index.is_complete():
+            messagebox.showinfo("Incomplete", "The puzzle is not complete yet!")
+            return
         
         #now we check if there are wrong cells (duplicates and stuff)
         if self.invalid_cells:
@@ -687,48 +820,7 @@ class SudokuSolver:
     # CHANGED: Updated to use box_size_rows and box_size_cols
     def validate_full_board(self):
         ####validate the entire board and highlight all invalid cells
-        self.invalid_cells = set()
-        
-        #check rows one by one
-        for row in range(self.size):
-            seen = {}
-            for col in range(self.size):
-                num = self.current_board[row][col]
-                if num != 0:
-                    if num in seen:
-                        self.invalid_cells.add((row, col))
-                        self.invalid_cells.add((row, seen[num]))
-                    else:
-                        seen[num] = col
-        
-        #check cols one by one
-        for col in range(self.size):
-            seen = {}
-            for row in range(self.size):
-                num = self.current_board[row][col]
-                if num != 0:
-                    if num in seen:
-                        self.invalid_cells.add((row, col))
-                        self.invalid_cells.add((seen[num], col))
-                    else:
-                        seen[num] = row
-        
-        #check the boxes (like 3x3 boxes in sudoku)
-        for box_row in range(0, self.size, self.box_size_rows):
-            for box_col in range(0, self.size, self.box_size_cols):
-                seen = {}
-                for i in range(self.box_size_rows):
-                    for j in range(self.box_size_cols):
-                        if box_row + i < self.size and box_col + j < self.size:
-                            row, col = box_row + i, box_col + j
-                            num = self.current_board[row][col]
-                            if num != 0:
-                                if num in seen:
-                                    self.invalid_cells.add((row, col))
-                                    prev_row, prev_col = seen[num]
-                                    self.invalid_cells.add((prev_row, prev_col))
-                                else:
-                                    seen[num] = (row, col)
+        #(the conflict index keeps invalid_cells exact, so there is nothing to rescan)
         
          #now update screen to show red cells
         self.update_board_display()
@@ -736,44 +828,58 @@ class SudokuSolver:
         return len(self.invalid_cells) == 0
     
     
-    def update_board_display(self):
-               #update the board on screen so it shows whatever numbers we have right now
-        for i in range(self.size):
-            for j in range(self.size):
-                cell_value = self.current_board[i][j]
-                
-                cell_entry = self.cell_entries[i][j]
-                
-                #put the number inside the box, or leave empty if it's 0
-                if cell_value == 0:
-                    cell_entry.delete(0, tk.END)
-                else:
-                    cell_entry.delete(0, tk.END)
-                    cell_entry.insert(0, str(cell_value))
-                
-                #decide background color based on which box it's in
-                box_row, box_col = i // self.box_size_rows, j // self.box_size_cols
-                is_even_box = (box_row + box_col) % 2 == 0
-                base_bg_color = COLORS["bg_light"] if is_even_box else COLORS["bg_medium"]
-                
-                #now set background if selected or invalid
-                if (i, j) == self.selected_cell:
-                    cell_entry.configure(bg=COLORS["selected"])
-                elif (i, j) in self.invalid_cells:
-                    cell_entry.configure(bg=COLORS["invalid"])  #highlight invalid cells (with red)
-                else:
-                    cell_entry.configure(bg=base_bg_color)
-                
-                #set the text color and state based on whether it's an original number or a number typed by tthe user
-                if self.original_board[i][j] != 0:
-                    cell_entry.configure(fg=COLORS["original_cell"], state="disabled")
-                else:
-                    cell_entry.configure(fg=COLORS["user_cell"], state="normal")
+    def cell_look(self, i, j):
+        #what a cell should look like right now: (text, background, is it an original number)
+        cell_value = self.current_board[i][j]
+        
+        #decide background color based on which box it's in
+        box_row, box_col = i // self.box_size_rows, j // self.box_size_cols
+        is_even_box = (box_row + box_col) % 2 == 0
+        base_bg_color = COLORS["bg_light"] if is_even_box else COLORS["bg_medium"]
+        
+        #now set background if selected or invalid
+        if (i, j) == self.selected_cell:
+            bg_color = COLORS["selected"]
+        elif (i, j) in self.invalid_cells:
+            bg_color = COLORS["invalid"]  #highlight invalid cells (with red)
+        else:
+            bg_color = base_bg_color
+        
+        return (str(cell_value) if cell_value else "", bg_color, self.original_board[i][j] != 0)
+    
+    def update_board_display(self, cells=None):
+        #update the board on screen so it shows whatever numbers we have right now.
+        #the board view remembers what each cell last drew and only touches cells
+        #whose text, colour or state changed; 'cells' limits the check to those cells
+        if cells is None:
+            cells = [(i, j) for i in range(self.size) for j in range(self.size)]
+        for i, j in cells:
+            self.board_view.draw(i, j, self.cell_look(i, j))
+    
+    def request_redraw(self, cells=None):
+        #mark cells dirty and redraw them all in one go once Tk is idle, so a burst of
+        #edits (key repeat, a pasted run of digits) costs a single redraw; None = whole board
+        if cells is None:
+            self.dirty_cells = None
+        elif self.dirty_cells is not None:
+            self.dirty_cells.update(cells)
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self.flush_redraw)
+    
+    def flush_redraw(self):
+        #draw everything request_redraw collected
+        self.redraw_pending = False
+        cells, self.dirty_cells = self.dirty_cells, set()
+        self.update_board_display(cells)
 
     def solve_puzzle(self):
         #here we start solving the sudoku using the selected method
-        if self.solving:
-            return #if already solving, don't do anything
+        if self.solving or self.waiting_for_puzzle is not None:
+            return #if already solving (or about to switch boards), don't do anything
+        if self.solver_thread is not None:
+            #a stopped run may still be writing its checkpoint; it finishes within a few nodes
+            self.solver_thread.join()
 
       
         self.start_time = time.time()   #store the start time when solving begins
@@ -802,8 +908,9 @@ class SudokuSolver:
         #set solving flag to true
         self.solving = True
 
-        #disabling the solve button
+        #disabling the solve button (and letting the user stop the run instead)
         self.solve_btn.configure(state=tk.DISABLED)
+        self.stop_btn.configure(state=tk.NORMAL)
 
         #this is to check if the puzzle is already solved before starting the solver
         if self.is_puzzle_already_solved():
@@ -817,233 +924,133 @@ class SudokuSolver:
             self.status_var.set("Puzzle already solved!")
             self.solving = False
             self.solve_btn.configure(state=tk.NORMAL)
+            self.stop_btn.configure(state=tk.DISABLED)
             return
 
-        #start solving in a separate thread
-        self.solver_thread = threading.Thread(target=self.run_solver)
+        #offer to carry on a run of this puzzle that was stopped earlier
+        self.resume_checkpoint = self.find_checkpoint()
+        if self.resume_checkpoint is not None and not messagebox.askyesno(
+                "Resume?", "This puzzle was stopped part-way with this algorithm.\n"
+                           "Continue from where it stopped?"):
+            self.resume_checkpoint = None
+
+        #no puzzle generation while the solve is timed, so it has the CPU to itself
+        self.puzzle_pool.pause()
+
+        #start solving in a separate thread; it never touches Tk, it only
+        #feeds the stats channel that update_stats_display drains every frame
+        self.stats_channel = StatsChannel()
+        self.solver_control = SolverControl(on_progress=self.stats_channel,
+                                            checkpoint_path=self.checkpoint_path)
+        self.solver_thread = threading.Thread(target=self.run_solver,
+                                              args=(self.make_board(self.current_board), self.algo_var.get(),
+                                                    self.solver_control, self.stats_channel))
         self.solver_thread.daemon = True
         self.solver_thread.start()
     
+    def find_checkpoint(self):
+        #the saved checkpoint, if it was made for this board and algorithm
+        algorithm = self.algo_var.get()
+        if algorithm not in RESUMABLE or not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            checkpoint = read_checkpoint(self.checkpoint_path)
+        except (OSError, ValueError):
+            return None
+        if checkpoint["algorithm"] != algorithm or checkpoint["puzzle"] != self.flattened_board:
+            return None
+        return checkpoint
+
     def is_puzzle_already_solved(self):
         ##check if the puzzle is already solved
         #see if the board is already completed and correct
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.current_board[i][j] == 0:
-                    return False #if any empty cell found, not solved yet
+        if not self.conflict_index.is_complete():
+            return False #if any empty cell found, not solved yet
         
         return self.validate_full_board() #check if everything is valid
     
     def stop_solving(self):
          #stop the solving process if it's running
         self.solving = False
+        if self.solver_control is not None:
+            self.solver_control.stop()
         if self.solver_thread and self.solver_thread.is_alive():
             #wait for the thread to finish, give it a little time to stop
             self.solver_thread.join(0.1)
         
-        self.solve_btn.configure(state=tk.NORMAL) #enable solve button again
+        #enable solve button again, unless a new game is about to replace the board
+        self.solve_btn.configure(state=tk.NORMAL if self.waiting_for_puzzle is None else tk.DISABLED)
+        self.stop_btn.configure(state=tk.DISABLED)
+        self.puzzle_pool.resume()
     
-    def run_solver(self):
-        ##Run the selected solver algorithm, (either backtracking or geentic)
-        algorithm = self.algo_var.get()
-        
-        if algorithm == "genetic":
-            self.run_genetic_solver()
-        else:
-            self.run_backtracking_solver()
-
-
-
-
-  
-        ##run the genetic algorithm solver with size-optimized parameters
-        #solve sudoku using the genetic algorithm method
-        #first start timing and memory tracking
-    def run_genetic_solver(self):
-       ##run the genetic algorithm solver with size-optimized parameters
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / (1024 * 1024)  # Memory usage in MB
-        
-        # Calculate puzzle difficulty
-        empty_cells = sum(1 for row in self.current_board for cell in row if cell == 0)
-        puzzle_difficulty = empty_cells / (self.size * self.size)  
-        
-        # Set parameters based on puzzle size and difficulty
-        if self.size <= 3:
-            population_size = 20
-            max_generations = 100
-            mutation_rate = 0.3
-            tournament_size = 2
-            stagnation_limit = 10
-        elif self.size <= 6:
-            population_size = 100
-            max_generations = 1000
-            mutation_rate = 0.35
-            tournament_size = 4
-            stagnation_limit = 30
-        else:
-            population_size = 150
-            max_generations = 2000
-            mutation_rate = 0.3
-            tournament_size = 5
-            stagnation_limit = 50
-
-        # Set early termination point depending on puzzle size
-        if self.size <= 3:
-            early_termination_threshold = int(max_generations * 0.3)  # ~30 iterations
-        elif self.size <= 6:
-            early_termination_threshold = int(max_generations * 0.5)  # ~500 iterations
+    def pause_solving(self):
+        #the stop button: stop the solver but leave the board as it is; a resumable
+        #solver saves its run on the way out, and the next Solve offers to continue it
+        if not self.solving:
+            return
+        self.stop_solving()
+        if self.algo_var.get() in RESUMABLE:
+            self.status_var.set("Stopped - press Solve to continue from here")
         else:
-            early_termination_threshold = int(max_generations * 0.75)  # ~1500 iterations
-                
-        # Initialize population
-        population = []
-        for _ in range(population_size):
-            gnome = self.create_gnome_2d()
-            fitness = self.calculate_fitness_2d(gnome)
-            population.append((gnome, fitness))
-        
-        # Sort population by fitness (lower is better)
-        population.sort(key=lambda x: x[1])
-        
-        best_fitness = population[0][1]
-        best_solution_ever = population[0][0]
-        best_fitness_ever = best_fitness
-        stagnation_counter = 0
-        
-        # Update stats right after starting
-        self.iterations = 1
-        self.elapsed_time = time.time() - self.start_time
-        self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-        self.fitness = population[0][1]
-        
-        # Update UI with initial stats
-        self.root.after(0, lambda: self.update_stats_ui())
-        
-        # Check if we already found a perfect solution
-        perfect_solution_found = False
-        if self.is_valid_solution_2d(population[0][0]) and population[0][1] == 0:
-            perfect_solution_found = True
-            best_solution_ever = population[0][0]
-            best_fitness_ever = population[0][1]
-        
-        # MAIN LOOP - Start the main loop for generations
-        for generation in range(1, max_generations + 1):
-            if not self.solving:
-                break # Stop if solving is stopped
-                
-            self.iterations = generation
-            
-            # Update progress bar
-            self.progress_var.set(min(99, (generation / max_generations) * 100))
-            
-            # Update stats (time, memory, fitness)
-            self.elapsed_time = time.time() - self.start_time
-            self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-            self.fitness = population[0][1]
-            
-            # Update the UI every 5 generations to keep it smooth
-            if generation % 5 == 0: 
-                self.root.after(0, lambda: self.update_stats_ui())
-        
-            # Check for early termination
-            if perfect_solution_found and generation >= early_termination_threshold:
-                # Add a small random chance to continue even after threshold
-                if random.random() > 0.1:  # 90% chance to stop
-                    break
-            
-            # Check for stagnation
-            if stagnation_counter >= stagnation_limit:
-                acceptable_fitness = self.size // 2  # Scale based on board size
-                if population[0][1] <= acceptable_fitness:
-                    break
-
-            # Check again if we got a perfect solution
-            if not perfect_solution_found and self.is_valid_solution_2d(population[0][0]) and population[0][1] == 0:
-                perfect_solution_found = True
-                best_solution_ever = population[0][0]
-                best_fitness_ever = population[0][1]
+            self.status_var.set("Stopped")
     
-                self.status_var.set(f"Solution found at iteration {generation}, confirming...")
-            
-            # Make a new generation
-            new_population = []
-            
-            # Keep the best solutions (elitism)
-            elite_count = max(2, self.size // 3)  
-            for i in range(min(elite_count, len(population))):
-                new_population.append(population[i])
-            
-            # Fill the rest of the population with offspring
-            while len(new_population) < population_size:
-                # Tournament selection for parent 1
-                tournament1 = random.sample(population, min(tournament_size, len(population)))
-                tournament1.sort(key=lambda x: x[1])
-                parent1 = tournament1[0][0]
-                
-                # Tournament selection for parent 2
-                tournament2 = random.sample(population, min(tournament_size, len(population)))
-                tournament2.sort(key=lambda x: x[1])
-                parent2 = tournament2[0][0]
-                
-                # Create offspring
-                child = self.mate_2d(parent1, parent2, mutation_rate)
-                child_fitness = self.calculate_fitness_2d(child)
-                
-                # Add the child to the new population
-                new_population.append((child, child_fitness))
-            
-            # Replace old population with the new one
-            population = new_population
-            population.sort(key=lambda x: x[1])
-            
-            # Check for improvement
-            if population[0][1] < best_fitness:
-                best_fitness = population[0][1]
-                stagnation_counter = 0
-                
-                # Track the best solution ever seen
-                if population[0][1] < best_fitness_ever:
-                    best_solution_ever = population[0][0]
-                    best_fitness_ever = population[0][1]
-            else:
-                stagnation_counter += 1 # If no improvement, add to stagnation counter
-            
-            # Add diversity if stuck
-            if stagnation_counter >= stagnation_limit // 2:
-                diversity_count = population_size // 4
-                for i in range(diversity_count):
-                    gnome = self.create_gnome_2d()
-                    fitness = self.calculate_fitness_2d(gnome)
-                    population.append((gnome, fitness))
-                
-                # Keep only the best ones after adding randomness
-                population.sort(key=lambda x: x[1])
-                population = population[:population_size]
-                stagnation_counter = 0
-        
-        # Use the best solution found during the entire run
-        self.current_board = [row[:] for row in best_solution_ever]  # Deep copy the 2D solution
-        self.fitness = best_fitness_ever
+    def close(self):
+        #stop the solver and remove this window's checkpoint before closing
+        self.stop_solving()
+        if self.solver_thread is not None:
+            self.solver_thread.join()
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self.puzzle_pool.close()
+        self.root.destroy()
+    
+    def run_solver(self, puzzle, algorithm, control, channel):
+        ##Run the selected solver algorithm (see ALGORITHM_OPTIONS) on the solver thread
+        result = solve(puzzle, algorithm, control, resume=self.resume_checkpoint)
+
+        #a run that finished leaves nothing to resume
+        if algorithm in RESUMABLE and not control.should_stop() and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
         
-        # Final stats update
-        self.elapsed_time = time.time() - self.start_time
-        self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-        self.progress_var.set(100)
+        #hand the result to the UI thread, which picks it up on its next frame
+        channel.finish(result)
+
+    def finish_solving(self, result):
+        #show the solver's result (on the UI thread)
+        #copy the final stats over for the stats panel
+        self.iterations = result.stats.iterations
+        self.elapsed_time = result.stats.elapsed_time
+        self.memory_used = result.stats.memory_used
+        self.fitness = result.stats.fitness
         
-        # Update status text
-        self.status_var.set(f"Puzzle solved in {self.iterations} iterations!")
+        if self.solving:
+            if result.algorithm in GENETIC_ALGORITHMS and result.board is not None:
+                #the genetic solver always hands back its best board, solved or not
+                self.current_board = result.board.to_list()
+                self.reset_conflicts()
+                if result.solved:
+                    self.progress_var.set(100)
+                    self.status_var.set(f"Puzzle solved in {self.iterations} iterations!")
+                else:
+                    #its conflicts are highlighted, so the user can see what's left
+                    self.status_var.set(f"No solution found; best board after {self.iterations} iterations "
+                                        f"has {len(self.invalid_cells)} conflicting cells")
+                self.update_board_display()
+            elif result.solved:
+                self.current_board = result.board.to_list()
+                self.reset_conflicts()
+                self.progress_var.set(100)
+                self.status_var.set("Puzzle solved!")
+                self.update_board_display()
         
-        # Update display
-        self.root.after(0, self.update_board_display)
-        self.root.after(0, self.update_stats_ui)
+        self.update_stats_ui()
         
-        # Reset solving state
+        #reset solving status
         self.solving = False
-        self.root.after(0, lambda: self.solve_btn.configure(state=tk.NORMAL))
-
-
-
+        self.stats_channel = None
+        self.solve_btn.configure(state=tk.NORMAL if self.waiting_for_puzzle is None else tk.DISABLED)
+        self.stop_btn.configure(state=tk.DISABLED)
+        self.puzzle_pool.resume()
 
     def update_stats_ui(self):
         #update the statistics UI elements
@@ -1052,363 +1059,29 @@ class SudokuSolver:
         self.memory_var.set(f"{self.memory_used:.2f} MB")  #update how much memory we used
         
         #only show fitness value if we are using genetic algorithm
-        if self.algo_var.get() == "genetic":
+        if self.algo_var.get() in GENETIC_ALGORITHMS:
             self.fitness_var.set(f"{self.fitness}")
         else:
             self.fitness_var.set("N/A")
     
 
-     #now run the backtracking solver
-    def run_backtracking_solver(self):
-        """Run the backtracking algorithm solver using 2D representation"""
-        # Start tracking time and memory
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / (1024 * 1024)  # Convert to MB
-        
-        # Create a 2D board from the current board
-        board_2d = [row[:] for row in self.current_board]
-        
-        # Update stats immediately before starting
-        self.iterations = 0
-        self.elapsed_time = time.time() - self.start_time
-        self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-        self.root.after(0, lambda: self.update_stats_ui())
-        
-        # Define the recursive backtrack function
-        def backtrack(board_2d):
-            if not self.solving:
-                return False
-                
-            self.iterations += 1
-            
-            # Update UI every 10 moves/iterations
-            if self.iterations % 10 == 0:  
-                self.elapsed_time = time.time() - self.start_time
-                self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-                self.progress_var.set(min(99, (self.iterations / 10000) * 100))
-                self.root.after(0, lambda: self.update_stats_ui())
-            
-            # Find an empty cell
-            empty_cell = None
-            for row in range(self.size):
-                for col in range(self.size):
-                    if board_2d[row][col] == 0:
-                        empty_cell = (row, col)
-                        break
-                if empty_cell:
-                    break
-            
-            if empty_cell is None:
-                # Board is full (no empty cell found), solution is found
-                return True
-            
-            row, col = empty_cell
-            
-            for num in range(1, self.size + 1):
-                if self.is_valid_2d(board_2d, row, col, num):
-                    board_2d[row][col] = num
-                    
-                    if backtrack(board_2d): # Recursive call
-                        return True
-                    
-                    # If we get here, this path didn't work, so we backtrack
-                    board_2d[row][col] = 0
-            
-            # No solution was found in this branch
-            return False
-        
-        # Start backtracking
-        result = backtrack(board_2d)
-        
-        # After done, update the stats
-        self.elapsed_time = time.time() - self.start_time
-        self.memory_used = (process.memory_info().rss / (1024 * 1024)) - initial_memory
-        
-        if self.iterations == 0:
-            self.iterations = 1
-        
-        self.root.after(0, lambda: self.update_stats_ui())
-        
-        if result and self.solving:
-            # Update the current board with the solution
-            self.current_board = [row[:] for row in board_2d]
-            self.progress_var.set(100)
-
-            self.status_var.set("Puzzle solved!")
-            
-            self.root.after(0, self.update_board_display)
-        
-        # Reset solving status
-        self.solving = False
-        self.root.after(0, lambda: self.solve_btn.configure(state=tk.NORMAL))
-
-    def is_valid_2d(self, board_2d, row, col, num):
-        """Check if a move is allowed (valid) in 2D board"""
-        # Check row
-        for c in range(self.size):
-            if board_2d[row][c] == num:
-                return False
-        
-        # Check column
-        for r in range(self.size):
-            if board_2d[r][col] == num:
-                return False
-        
-        # Check box
-        box_row_start = (row // self.box_size_rows) * self.box_size_rows
-        box_col_start = (col // self.box_size_cols) * self.box_size_cols
-        
-        for r in range(box_row_start, box_row_start + self.box_size_rows):
-            for c in range(box_col_start, box_col_start + self.box_size_cols):
-                if r < self.size and c < self.size:
-                    if board_2d[r][c] == num:
-                        return False
-        
-        return True
-
-    # The solve_board and is_valid_placement functions are already using 2D representation
-    # so they don't need to be changed
-
-    def solve_board(self, board):
-        """Solve the board using backtracking"""
-        for row in range(self.size):
-            for col in range(self.size):
-                if board[row][col] == 0:
-                    for num in range(1, self.size + 1):
-                        if self.is_valid_placement(board, row, col, num):
-                            board[row][col] = num
-                            
-                            if self.solve_board(board):
-                                return True
-                            
-                            board[row][col] = 0
-                    
-                    return False
-        
-        return True
-
-    def is_valid_placement(self, board, row, col, num):
-        """Check if placing 'num' at position (row, col) is valid"""
-        # Check row
-        for x in range(self.size):
-            if board[row][x] == num:
-                return False
-        
-        # Check column
-        for x in range(self.size):
-            if board[x][col] == num:
-                return False
-        
-        # Check box
-        box_row, box_col = row - row % self.box_size_rows, col - col % self.box_size_cols
-        for i in range(self.box_size_rows):
-            for j in range(self.box_size_cols):
-                if box_row + i < self.size and box_col + j < self.size:
-                    if board[box_row + i][box_col + j] == num:
-                        return False
-        
-        return True
-    
-    def create_gnome_2d(self):
-        """Create a chromosome (candidate solution) for genetic algorithm using 2D representation"""
-        # Start with a copy of the current board
-        board_2d = [row[:] for row in self.current_board]
-        
-        # First try to fill easy cells that have only 1 valid number
-        progress = True
-        while progress:
-            progress = False
-            for row in range(self.size):
-                for col in range(self.size):
-                    if board_2d[row][col] == 0:  # Only empty cells
-                        valid_numbers = self.get_valid_numbers(board_2d, row, col)
-                        if len(valid_numbers) == 1:
-                            board_2d[row][col] = valid_numbers[0]
-                            progress = True
-        
-        # Fill the rest randomly but valid where possible
-        for row in range(self.size):
-            for col in range(self.size):
-                if board_2d[row][col] == 0: 
-                    valid_numbers = self.get_valid_numbers(board_2d, row, col)
-                    
-                    if valid_numbers:
-                        board_2d[row][col] = random.choice(valid_numbers)
-                    else:
-                        board_2d[row][col] = random.randint(1, self.size)
-        
-        return board_2d
-
-    def get_valid_numbers(self, board_2d, row, col):
-        """Find what numbers can go in this specific position on the 2D board"""
-        used_numbers = set()
-        
-        # Check row - simply iterate through all columns in the current row
-        for c in range(self.size):
-            used_numbers.add(board_2d[row][c])
-        
-        # Check column - iterate through all rows in the current column
-        for r in range(self.size):
-            used_numbers.add(board_2d[r][col])
-        
-        # Check box - find the top-left corner of the box containing this cell
-        box_row_start = (row // self.box_size_rows) * self.box_size_rows
-        box_col_start = (col // self.box_size_cols) * self.box_size_cols
-        
-        # Iterate through all cells in the box
-        for r in range(box_row_start, box_row_start + self.box_size_rows):
-            for c in range(box_col_start, box_col_start + self.box_size_cols):
-                if r < self.size and c < self.size:
-                    used_numbers.add(board_2d[r][c])
-        
-        # Return available numbers (numbers 1 to size that are not in used_numbers)
-        return [num for num in range(1, self.size + 1) if num not in used_numbers]
-
-    def calculate_fitness_2d(self, board_2d):
-        """Calculate fitness score for a 2D board (lower = better)"""
-        fitness = 0
-        
-        # Penalize empty cells
-        for row in range(self.size):
-            for col in range(self.size):
-                if board_2d[row][col] == 0:
-                    fitness += 10
-
-        # Check rows for duplicates
-        for row in range(self.size):
-            seen = set()
-            for col in range(self.size):
-                value = board_2d[row][col]
-                if value != 0:
-                    if value in seen:
-                        fitness += 1
-                    seen.add(value)
-        
-        # Check columns for duplicates
-        for col in range(self.size):
-            seen = set()
-            for row in range(self.size):
-                value = board_2d[row][col]
-                if value != 0:
-                    if value in seen:
-                        fitness += 1
-                    seen.add(value)
-        
-        # Check boxes for duplicates
-        for box_row in range(0, self.size, self.box_size_rows):
-            for box_col in range(0, self.size, self.box_size_cols):
-                seen = set()
-                for row in range(box_row, box_row + self.box_size_rows):
-                    for col in range(box_col, box_col + self.box_size_cols):
-                        if row < self.size and col < self.size:
-                            value = board_2d[row][col]
-                            if value != 0:
-                                if value in seen:
-                                    fitness += 1
-                                seen.add(value)
-        
-        # Penalize changes to original cells
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.original_board[row][col] != 0 and board_2d[row][col] != self.original_board[row][col]:
-                    fitness += 5
-        
-        return fitness
-
-    def mate_2d(self, parent1, parent2, mutation_rate=0.2):
-        """Combine two parent solutions to create a child solution using 2D representation"""
-        # Create an empty child board
-        child = [[0 for _ in range(self.size)] for _ in range(self.size)]
-        
-        # Fill in the original clues first
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.original_board[row][col] != 0:
-                    # Keep original clue
-                    child[row][col] = self.original_board[row][col]
-        
-        # Fill in the rest of the cells
-        for row in range(self.size):
-            for col in range(self.size):
-                if child[row][col] == 0:  # Skip cells that already have original clues
-                    # Decide whether to mutate
-                    if random.random() < mutation_rate:
-                        # Try to find valid numbers for this position
-                        valid_numbers = self.get_valid_numbers(child, row, col)
-                        
-                        if valid_numbers:
-                            child[row][col] = random.choice(valid_numbers)
-                        else:
-                            # If no valid numbers, choose from parents or random
-                            p1_val = parent1[row][col] if parent1[row][col] != 0 else random.randint(1, self.size)
-                            p2_val = parent2[row][col] if parent2[row][col] != 0 else random.randint(1, self.size)
-                            child[row][col] = p1_val if random.random() < 0.5 else p2_val
-                    else:
-                        # Choose from parents (never allow zeros)
-                        p1_val = parent1[row][col] if parent1[row][col] != 0 else random.randint(1, self.size)
-                        p2_val = parent2[row][col] if parent2[row][col] != 0 else random.randint(1, self.size)
-                        child[row][col] = p1_val if random.random() < 0.5 else p2_val
-        
-        # Make sure no zeros are left in the child
-        for row in range(self.size):
-            for col in range(self.size):
-                if child[row][col] == 0:
-                    valid_numbers = self.get_valid_numbers(child, row, col)
-                    if valid_numbers:
-                        child[row][col] = random.choice(valid_numbers)
-                    else:
-                        child[row][col] = random.randint(1, self.size)
-        
-        return child
-
-    def is_valid_solution_2d(self, board_2d):
-        """Check if a 2D solution is valid (no duplicates in rows, columns, boxes)"""
-        # Check for any zeros (incomplete solution)
-        for row in range(self.size):
-            for col in range(self.size):
-                if board_2d[row][col] == 0:
-                    return False
-        
-        # Check rows
-        for row in range(self.size):
-            if len(set(board_2d[row])) != self.size:
-                return False
-        
-        # Check columns
-        for col in range(self.size):
-            column_values = [board_2d[row][col] for row in range(self.size)]
-            if len(set(column_values)) != self.size:
-                return False
-        
-        # Check boxes
-        for box_row in range(0, self.size, self.box_size_rows):
-            for box_col in range(0, self.size, self.box_size_cols):
-                box_values = []
-                for row in range(box_row, box_row + self.box_size_rows):
-                    for col in range(box_col, box_col + self.box_size_cols):
-                        if row < self.size and col < self.size:
-                            box_values.append(board_2d[row][col])
-                if len(set(box_values)) != self.size:
-                    return False
-        
-        return True
-    
     def update_stats_display(self):
-       #keep showing updated stats on screen
-        if self.solving:
-            #update statistics labels
-            self.iterations_var.set(f"{self.iterations:,}")
-            self.time_var.set(f"{self.elapsed_time:.2f}s")
-            self.memory_var.set(f"{self.memory_used:.2f} MB")
-            
-            if self.algo_var.get() == "genetic":
-                self.fitness_var.set(f"{self.fitness}")
-                self.fitness_label.grid()
-            else:
-                self.fitness_var.set("N/A")
-                self.fitness_label.grid()
-        
-        self.root.after(20, self.update_stats_display)  #update every 20 milliseconds
+       #once per frame, show the newest stats the solver reported (if any) and pick up
+       #its result when it is done. However often the solver reports, this costs
+       #one drain and at most one stats update per frame
+        if self.stats_channel is not None:
+            latest, result = self.stats_channel.drain()
+            if latest is not None:
+                self.iterations = latest["iterations"]
+                self.elapsed_time = latest["elapsed_time"]
+                self.memory_used = latest["memory_used"]
+                self.fitness = latest["fitness"]
+                self.progress_var.set(latest["progress"])
+                self.update_stats_ui()
+            if result is not None:
+                self.finish_solving(result)
+        
+        self.root.after(FRAME_INTERVAL_MS, self.update_stats_display)
 
 
 # Main entry point
@@ -1429,5 +1102,5 @@ if __name__ == "__main__":
     center_y = int(screen_height/2 - window_height/2)
     root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
     
-    app = SudokuSolver(root)
+    app = SudokuSolver(root, "entry" if "--entry" in sys.argv else "canvas")
     root.mainloop()
\ No newline at end of file
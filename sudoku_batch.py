@@ -0,0 +1,158 @@
+"""Batch solving of puzzle files in the flattened-board format.
+
+Each input line is one puzzle written the way flatten_board() writes it
+(row by row, 0 or '.' for an empty cell, A-P for 10-25 on big boards). Lines
+are streamed through a chain of generators, so memory stays flat however long
+the file is, and no GUI is ever created. Each result is written as one JSON
+line.
+
+    python sudoku_batch.py puzzles.txt -a dlx -o solutions.jsonl
+    cat puzzles.txt | python sudoku_batch.py -a mrv
+    python sudoku_batch.py puzzles.txt -j 0      # one worker process per core
+"""
+import argparse
+import collections
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from sudoku_engine import BOX_SIZES, CELL_CHARS, MEMORY_METERS, SOLVERS, SudokuBoard, SolverControl, solve
+
+
+def read_puzzles(stream):
+    """Yield (line_number, text) for every non-blank, non-comment line"""
+    for line_number, line in enumerate(stream, 1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield line_number, text
+
+
+def parse_puzzle(text):
+    """Turn one flattened line into a SudokuBoard (ValueError if it isn't one)"""
+    text = text.replace(".", "0").upper()
+    size = int(round(len(text) ** 0.5))
+    if size * size != len(text) or not set(text) <= set(CELL_CHARS[:size + 1]):
+        raise ValueError(f"not a flattened board: {text!r}")
+    if size not in BOX_SIZES:
+        raise ValueError(f"unsupported board size {size}×{size}")
+    return SudokuBoard.from_flat(text, size)
+
+
+def solve_one(line_number, text, algorithm, control):
+    """Solve a single input line and return its result dict"""
+    try:
+        puzzle = parse_puzzle(text)
+    except ValueError as error:
+        return {"line": line_number, "puzzle": text, "error": str(error)}
+    result = solve(puzzle, algorithm, control).to_dict()
+    result["line"] = line_number
+    result["puzzle"] = text
+    return result
+
+
+def solve_puzzles(puzzles, algorithm="dlx", memory=None, budget=None):
+    """Solve each (line_number, text) and yield a result dict per puzzle; with a
+    'budget' in seconds each puzzle gets that long and returns its best board"""
+    control = SolverControl(memory=memory, time_budget=budget)
+    for line_number, text in puzzles:
+        yield solve_one(line_number, text, algorithm, control)
+
+
+#solvers that start processes of their own, which daemonic pool workers cannot
+PROCESS_ALGORITHMS = {"islands"}
+
+#each worker process keeps one SolverControl for all the puzzles it is sent
+_worker_control = None
+
+
+def _solve_chunk(args):
+    global _worker_control
+    chunk, algorithm, memory, budget = args
+    if _worker_control is None:
+        _worker_control = SolverControl(memory=memory, time_budget=budget)
+    return [solve_one(line_number, text, algorithm, _worker_control) for line_number, text in chunk]
+
+
+def chunked(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_puzzles_parallel(puzzles, algorithm="dlx", workers=None, chunksize=64, memory=None, budget=None):
+    """Like solve_puzzles, but spread over a pool of worker processes.
+
+    Puzzles are sent in chunks of 'chunksize' to keep IPC overhead low, results
+    come back in input order, and only a few chunks per worker are in flight at
+    once so memory stays bounded on huge inputs. "islands" cannot run here: it
+    starts processes of its own, which pool workers are not allowed to do.
+    """
+    if algorithm in PROCESS_ALGORITHMS:
+        raise ValueError(f"{algorithm!r} starts its own processes; solve it with one worker")
+    workers = workers or os.cpu_count() or 1
+    pending = collections.deque()
+    with multiprocessing.Pool(workers) as pool:
+        for chunk in chunked(puzzles, chunksize):
+            pending.append(pool.apply_async(_solve_chunk, ((chunk, algorithm, memory, budget),)))
+            if len(pending) >= workers * 4:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+def write_results(results, out):
+    """Write each result as a JSON line; returns (count, solved)"""
+    count = solved = 0
+    for result in results:
+        out.write(json.dumps(result) + "\n")
+        count += 1
+        solved += bool(result.get("solved"))
+    return count, solved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of flattened sudoku puzzles.")
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file, one per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="where to write JSON lines ('-' for stdout)")
+    parser.add_argument("-a", "--algorithm", default="dlx", choices=sorted(SOLVERS))
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="worker processes (0 = one per core, 1 = solve in this process)")
+    parser.add_argument("--chunksize", type=int, default=64, help="puzzles sent to a worker at a time")
+    parser.add_argument("--memory", choices=sorted(MEMORY_METERS), default=None,
+                        help="how to measure memory per puzzle (default: sampled RSS if psutil is installed)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="seconds per puzzle; a puzzle still unsolved by then reports status 'timeout'")
+    args = parser.parse_args(argv)
+    if args.algorithm in PROCESS_ALGORITHMS and args.workers != 1:
+        parser.error(f"-a {args.algorithm} runs its own processes and needs -j 1")
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    start = time.perf_counter()
+    if args.workers == 1:
+        results = solve_puzzles(read_puzzles(source), args.algorithm, args.memory, args.budget)
+    else:
+        results = solve_puzzles_parallel(read_puzzles(source), args.algorithm,
+                                         args.workers or None, args.chunksize, args.memory, args.budget)
+    try:
+        count, solved = write_results(results, out)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"{solved}/{count} puzzles solved in {elapsed:.2f}s ({rate:,.0f} puzzles/s)", file=sys.stderr)
+    return 0 if solved == count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
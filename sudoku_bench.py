@@ -0,0 +1,175 @@
+"""Reproducible benchmark of every registered solver.
+
+A fixed corpus of puzzles is generated per board size and difficulty from a
+seed, so two runs with the same arguments measure the same puzzles. Every
+solver is run 'repeat' times on every puzzle; wall time, CPU time, search
+nodes (generations for the genetic solvers) and success are recorded per run,
+and peak memory comes from one extra run with the tracemalloc meter, so
+tracing never slows the timed runs (those measure no memory at all). CPU
+time and memory cover this process only, so the island workers are not
+counted. Results are written as JSON with percentiles.
+
+    python sudoku_bench.py -o bench.json
+    python sudoku_bench.py -s 9 12 -d hard -a mrv dlx --repeat 5
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from sudoku_engine import BOX_SIZES, SOLVERS, SolverControl, generate_puzzle, solve
+
+#share of the cells the generator tries to empty for each difficulty
+DIFFICULTIES = {
+    "easy": 0.4,
+    "medium": 0.5,
+    "hard": 0.6,
+}
+
+
+def build_corpus(sizes, difficulties, count, seed):
+    """Yield (size, difficulty, puzzle) for 'count' unique puzzles per size and
+    difficulty; each group has its own seeded generator, so adding a size does
+    not change the puzzles of the others"""
+    for size in sizes:
+        for difficulty in difficulties:
+            rng = random.Random(f"{seed}-{size}-{difficulty}")
+            for _ in range(count):
+                puzzle, _ = generate_puzzle(size, rng=rng, remove_fraction=DIFFICULTIES[difficulty])
+                yield size, difficulty, puzzle
+
+
+def solver_options(algorithm, seed):
+    """Seed the randomized solvers so their runs can be repeated"""
+    if algorithm == "islands":
+        return {"seed": seed}
+    if algorithm in ("genetic", "permutation", "hybrid"):
+        return {"rng": random.Random(seed)}
+    return {}
+
+
+def run_once(puzzle, algorithm, seed, timeout, memory="none"):
+    """Solve once and return (wall, cpu, result); 'timeout' is the run's time
+    budget, and a run that uses it up hands back its best board so far"""
+    control = SolverControl(memory=memory, time_budget=timeout)
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = solve(puzzle, algorithm, control, **solver_options(algorithm, seed))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return wall, cpu, result
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "min": values[0],
+        "p50": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": values[-1],
+        "mean": sum(values) / len(values),
+    }
+
+
+def run_benchmark(corpus, algorithms, repeat=3, timeout=10.0, seed=0, measure_memory=True,
+                  on_group=None):
+    """Run every algorithm over the corpus and return one summary dict per
+    (algorithm, size, difficulty); on_group is called with each as it finishes"""
+    groups = {}
+    for size, difficulty, puzzle in corpus:
+        groups.setdefault((size, difficulty), []).append(puzzle)
+
+    results = []
+    for (size, difficulty), puzzles in groups.items():
+        for algorithm in algorithms:
+            walls, cpus, iterations, memory = [], [], [], []
+            solved = timeouts = 0
+            for puzzle in puzzles:
+                for run in range(repeat):
+                    wall, cpu, result = run_once(puzzle, algorithm, seed + run, timeout)
+                    walls.append(wall)
+                    cpus.append(cpu)
+                    iterations.append(result.stats.iterations)
+                    solved += result.solved
+                    timeouts += result.status == "timeout"
+                if measure_memory:
+                    _, _, result = run_once(puzzle, algorithm, seed, timeout, "tracemalloc")
+                    memory.append(result.stats.peak_memory * 1024)
+
+            runs = len(walls)
+            group = {
+                "algorithm": algorithm,
+                "size": size,
+                "difficulty": difficulty,
+                "puzzles": len(puzzles),
+                "runs": runs,
+                "solved": solved,
+                "success_rate": solved / runs,
+                "timeouts": timeouts,
+                "wall_time": summarize(walls),
+                "cpu_time": summarize(cpus),
+                "iterations": summarize(iterations),
+                "peak_memory_kb": summarize(memory) if memory else None,
+            }
+            results.append(group)
+            if on_group is not None:
+                on_group(group)
+    return results
+
+
+def print_row(group, out=sys.stderr):
+    print(f"{group['algorithm']:>12} {group['size']:>3}×{group['size']:<3} {group['difficulty']:<7}"
+          f" {group['success_rate']:>6.0%} {group['wall_time']['p50'] * 1000:>10.2f}ms"
+          f" {group['wall_time']['p90'] * 1000:>10.2f}ms {group['iterations']['p50']:>10}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sudoku solvers on a seeded puzzle corpus.")
+    parser.add_argument("-o", "--output", default="-", help="where to write the JSON report ('-' for stdout)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=sorted(SOLVERS), choices=sorted(SOLVERS))
+    parser.add_argument("-s", "--sizes", nargs="+", type=int, default=[3, 6, 9], choices=sorted(BOX_SIZES))
+    parser.add_argument("-d", "--difficulties", nargs="+", default=list(DIFFICULTIES),
+                        choices=list(DIFFICULTIES))
+    parser.add_argument("-n", "--puzzles", type=int, default=5, help="puzzles per size and difficulty")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per puzzle and solver")
+    parser.add_argument("--timeout", type=float, default=10.0, help="time budget of each run, in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    args = parser.parse_args(argv)
+
+    print(f"{'algorithm':>12} {'size':^7} {'level':<7} {'solved':>6} {'p50 wall':>12} {'p90 wall':>12}"
+          f" {'p50 nodes':>10}", file=sys.stderr)
+    corpus = build_corpus(args.sizes, args.difficulties, args.puzzles, args.seed)
+    results = run_benchmark(corpus, args.algorithms, args.repeat, args.timeout, args.seed,
+                            not args.no_memory, print_row)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "puzzles": args.puzzles,
+            "repeat": args.repeat,
+            "timeout": args.timeout,
+        },
+        "results": results,
+    }
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        json.dump(report, out, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2430 @@
+"""Headless Sudoku engine: boards, solvers and the puzzle generator.
+
+Nothing in here imports tkinter, so a puzzle can be generated or solved
+without building a Tk root. The GUI in sudokuPuzzleGameCode1.py is a thin
+client of the functions below.
+"""
+import collections
+import functools
+import gzip
+import json
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+try:
+    import psutil
+except ImportError:  # memory stats are optional on headless nodes
+    psutil = None
+
+try:
+    import numpy as np
+except ImportError:  # the genetic solver falls back to per-board fitness
+    np = None
+
+
+#box layout (rows, cols) used for each supported board size
+BOX_SIZES = {
+    3: (1, 1),  # 1×1 boxes for 3×3
+    6: (2, 3),  # 2×3 boxes for 6×6
+    9: (3, 3),  # 3×3 boxes for 9×9
+    12: (3, 4),  # 3×4 boxes for 12×12
+    16: (4, 4),  # 4×4 boxes for 16×16
+    25: (5, 5),  # 5×5 boxes for 25×25
+}
+
+#one character per cell in the flattened format: 0 is empty, then 1-9 and
+#A-Z (base 36) so boards up to 25×25 still take one character per cell
+CELL_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+#search nodes the generator may spend proving that removing a clue keeps the
+#puzzle unique; harder checks just keep the clue
+GENERATOR_NODE_LIMIT = 512
+
+
+class SudokuBoard:
+    """A sudoku grid plus its box layout, stored as one flat bytearray.
+
+    Cell (row, col) is cells[row * size + col] and empty cells are 0, so a
+    copy is a single memcpy and a 9×9 board takes 81 bytes instead of nine
+    lists of boxed ints. board[row, col] reads and writes a cell.
+    """
+
+    __slots__ = ("size", "box_size_rows", "box_size_cols", "cells")
+
+    def __init__(self, size=9, box_size_rows=None, box_size_cols=None, cells=None):
+        if box_size_rows is None or box_size_cols is None:
+            box_size_rows, box_size_cols = BOX_SIZES[size]
+        self.size = size
+        self.box_size_rows = box_size_rows
+        self.box_size_cols = box_size_cols
+        if cells is None:
+            self.cells = bytearray(size * size)
+        elif isinstance(cells, (bytes, bytearray, memoryview)):
+            self.cells = bytearray(cells)  # already flat
+        else:
+            self.cells = bytearray(cell for row in cells for cell in row)
+
+    @classmethod
+    def from_flat(cls, flattened, size=None, box_size_rows=None, box_size_cols=None):
+        """Build a board from the one-line format written by flatten()"""
+        if size is None:
+            size = int(round(len(flattened) ** 0.5))
+        cells = flattened.encode("ascii").translate(_CELL_VALUES)
+        if len(cells) != size * size or max(cells, default=0) > size:
+            raise ValueError(f"not a flattened {size}×{size} board: {flattened!r}")
+        return cls(size, box_size_rows, box_size_cols, cells)
+
+    def copy(self):
+        return SudokuBoard(self.size, self.box_size_rows, self.box_size_cols, self.cells)
+
+    def __getitem__(self, position):
+        row, col = position
+        return self.cells[row * self.size + col]
+
+    def __setitem__(self, position, value):
+        row, col = position
+        self.cells[row * self.size + col] = value
+
+    def apply(self, index, value):
+        """Write 'value' into flat cell 'index' and return what was there, for undo()"""
+        previous = self.cells[index]
+        self.cells[index] = value
+        return previous
+
+    def undo(self, index, previous):
+        self.cells[index] = previous
+
+    def view(self):
+        """Read-only, zero-copy view of the cells (for hashlib, file writes, numpy)"""
+        return memoryview(self.cells).toreadonly()
+
+    def key(self):
+        """Immutable snapshot of the cells, usable as a dict or set key"""
+        return bytes(self.cells)
+
+    def __eq__(self, other):
+        if not isinstance(other, SudokuBoard):
+            return NotImplemented
+        return (self.size, self.box_size_rows, self.box_size_cols, self.cells) == \
+            (other.size, other.box_size_rows, other.box_size_cols, other.cells)
+
+    def flatten(self):
+        return encode_cells(self.cells)
+
+    def to_list(self):
+        """Return the cells as a fresh list of lists"""
+        size = self.size
+        return [list(self.cells[i:i + size]) for i in range(0, size * size, size)]
+
+    def empty_cells(self):
+        size = self.size
+        return [divmod(index, size) for index, cell in enumerate(self.cells) if cell == 0]
+
+    def is_complete(self):
+        return 0 not in self.cells
+
+    def is_valid_placement(self, row, col, num):
+        """Check if placing 'num' at position (row, col) is valid"""
+        return is_valid_placement(self.cells, row, col, num, self.size,
+                                  self.box_size_rows, self.box_size_cols)
+
+    def get_valid_numbers(self, row, col):
+        return get_valid_numbers(self.cells, row, col, self.size,
+                                 self.box_size_rows, self.box_size_cols)
+
+    def find_invalid_cells(self):
+        return find_invalid_cells(self.cells, self.size, self.box_size_rows, self.box_size_cols)
+
+    def is_valid_solution(self):
+        return is_valid_solution(self.cells, self.size, self.box_size_rows, self.box_size_cols)
+
+    def matches_clues(self, puzzle):
+        """True if every given of 'puzzle' is kept in this board"""
+        return all(given == 0 or given == cell for given, cell in zip(puzzle.cells, self.cells))
+
+    def __repr__(self):
+        return f"SudokuBoard({self.size}, {self.flatten()!r})"
+
+
+#bytes.translate tables between cell values and flattened characters
+_CELL_CHARS_TABLE = CELL_CHARS.encode("ascii").ljust(256, b"?")
+_CELL_VALUES = bytearray(b"\xff" * 256)
+_CELL_VALUES[ord(".")] = 0
+for _value, _char in enumerate(CELL_CHARS):
+    _CELL_VALUES[ord(_char)] = _CELL_VALUES[ord(_char.lower())] = _value
+_CELL_VALUES = bytes(_CELL_VALUES)
+
+
+def encode_cells(cells):
+    """Flat cells as text, one base-36 character per cell like flatten()"""
+    return bytes(cells).translate(_CELL_CHARS_TABLE).decode("ascii")
+
+
+def decode_cells(text):
+    """Inverse of encode_cells(): a flat bytearray"""
+    return bytearray(text.encode("ascii").translate(_CELL_VALUES))
+
+
+def flatten_board(board):
+    #convert a board (SudokuBoard or 2D list) to a flattened string (base-36, one character per cell)
+    if isinstance(board, SudokuBoard):
+        return board.flatten()
+    return encode_cells(cell for row in board for cell in row)
+
+
+def unflatten_board(flattened, size):
+    #then convert the flattened string back to a 2D board ('.' also means empty)
+    return SudokuBoard.from_flat(flattened, size, 1, 1).to_list()
+
+
+@functools.lru_cache(maxsize=None)
+def unit_table(size, box_size_rows, box_size_cols):
+    """Flat cell indices of every row, then every column, then every box"""
+    rows = [tuple(range(r * size, (r + 1) * size)) for r in range(size)]
+    cols = [tuple(range(c, size * size, size)) for c in range(size)]
+    boxes = [tuple(r * size + c
+                   for r in range(box_row, min(box_row + box_size_rows, size))
+                   for c in range(box_col, min(box_col + box_size_cols, size)))
+             for box_row in range(0, size, box_size_rows)
+             for box_col in range(0, size, box_size_cols)]
+    return tuple(rows + cols + boxes)
+
+
+@functools.lru_cache(maxsize=None)
+def box_table(size, box_size_rows, box_size_cols):
+    """For every flat cell index, the number of its box (boxes are numbered
+    row-major, so the last cell is in the last box)"""
+    boxes_per_row = -(-size // box_size_cols)
+    return tuple((index // size // box_size_rows) * boxes_per_row + (index % size) // box_size_cols
+                 for index in range(size * size))
+
+
+def is_valid_placement(cells, row, col, num, size, box_size_rows, box_size_cols):
+    """Check if placing 'num' at position (row, col) of flat 'cells' is valid"""
+    start = row * size
+    for x in range(size):
+        if cells[start + x] == num:
+            return False
+
+    for x in range(col, size * size, size):
+        if cells[x] == num:
+            return False
+
+    box_row, box_col = row - row % box_size_rows, col - col % box_size_cols
+    for r in range(box_row, min(box_row + box_size_rows, size)):
+        for c in range(box_col, min(box_col + box_size_cols, size)):
+            if cells[r * size + c] == num:
+                return False
+
+    return True
+
+
+def get_valid_numbers(cells, row, col, size, box_size_rows, box_size_cols):
+    """Find what numbers can go in this specific position of flat 'cells'"""
+    used_numbers = set(cells[row * size:(row + 1) * size])
+    used_numbers.update(cells[col::size])
+
+    box_row_start = (row // box_size_rows) * box_size_rows
+    box_col_start = (col // box_size_cols) * box_size_cols
+    for r in range(box_row_start, min(box_row_start + box_size_rows, size)):
+        start = r * size
+        used_numbers.update(cells[start + box_col_start:start + min(box_col_start + box_size_cols, size)])
+
+    return [num for num in range(1, size + 1) if num not in used_numbers]
+
+
+def find_invalid_cells(cells, size, box_size_rows, box_size_cols):
+    """Return the set of (row, col) cells that share a digit with a peer"""
+    invalid = set()
+    for unit in unit_table(size, box_size_rows, box_size_cols):
+        seen = {}
+        for index in unit:
+            num = cells[index]
+            if num != 0:
+                if num in seen:
+                    invalid.add(index)
+                    invalid.add(seen[num])
+                else:
+                    seen[num] = index
+    return {divmod(index, size) for index in invalid}
+
+
+def is_valid_solution(cells, size, box_size_rows, box_size_cols):
+    """Check if every row, column and box of flat 'cells' holds distinct digits
+    from 1..size (so every row and column is exactly {1..size})"""
+    digits = set(range(1, size + 1))
+    for unit in unit_table(size, box_size_rows, box_size_cols):
+        values = {cells[index] for index in unit}
+        if len(values) != len(unit) or not values <= digits:
+            return False
+    return True
+
+
+class ConflictIndex:
+    """Digit counts per row, column and box of a board that is being edited,
+    and the exact set of cells that currently clash with a peer.
+
+    set() keeps both up to date in O(peers): placing a digit flags it and any
+    peer holding the same digit, and removing one clears the peers it was
+    clashing with unless they still clash with something else. conflicts
+    holds (row, col) pairs, like find_invalid_cells().
+    """
+
+    def __init__(self, board):
+        size = board.size
+        self.size = size
+        self.stride = size + 1
+        self.box_of = box_table(size, board.box_size_rows, board.box_size_cols)
+        box_count = self.box_of[-1] + 1
+        self.peers = peer_table(size, board.box_size_rows, board.box_size_cols)
+        self.row_counts = bytearray(size * self.stride)
+        self.col_counts = bytearray(size * self.stride)
+        self.box_counts = bytearray(box_count * self.stride)
+        self.cells = bytearray(size * size)
+        self.filled = 0
+        self.conflicts = set()
+        for index, digit in enumerate(board.cells):
+            if digit:
+                self.set(index // size, index % size, digit)
+
+    def _slots(self, index, digit):
+        stride = self.stride
+        return (index // self.size * stride + digit, index % self.size * stride + digit,
+                self.box_of[index] * stride + digit)
+
+    def _refresh(self, index, changed):
+        """Re-derive whether cell 'index' clashes, recording it in 'changed' if that flipped"""
+        digit = self.cells[index]
+        clashing = False
+        if digit:
+            row_slot, col_slot, box_slot = self._slots(index, digit)
+            clashing = self.row_counts[row_slot] > 1 or self.col_counts[col_slot] > 1 \
+                or self.box_counts[box_slot] > 1
+        position = divmod(index, self.size)
+        if clashing != (position in self.conflicts):
+            if clashing:
+                self.conflicts.add(position)
+            else:
+                self.conflicts.discard(position)
+            changed.add(position)
+
+    def set(self, row, col, digit):
+        """Put 'digit' (0 to clear) at (row, col). Returns the cells whose value or
+        conflict status changed, i.e. the ones a display has to redraw"""
+        index = row * self.size + col
+        old = self.cells[index]
+        if old == digit:
+            return set()
+        changed = {(row, col)}
+        if old:
+            row_slot, col_slot, box_slot = self._slots(index, old)
+            self.row_counts[row_slot] -= 1
+            self.col_counts[col_slot] -= 1
+            self.box_counts[box_slot] -= 1
+            self.cells[index] = 0
+            self.filled -= 1
+            self._refresh(index, changed)
+            for peer in self.peers[index]:
+                if self.cells[peer] == old:
+                    self._refresh(peer, changed)
+        if digit:
+            row_slot, col_slot, box_slot = self._slots(index, digit)
+            self.row_counts[row_slot] += 1
+            self.col_counts[col_slot] += 1
+            self.box_counts[box_slot] += 1
+            self.cells[index] = digit
+            self.filled += 1
+            self._refresh(index, changed)
+            for peer in self.peers[index]:
+                if self.cells[peer] == digit:
+                    self._refresh(peer, changed)
+        return changed
+
+    def is_valid_placement(self, row, col, digit):
+        """O(1) version of is_valid_placement(): would 'digit' at (row, col) clash with a peer?"""
+        index = row * self.size + col
+        own = 1 if self.cells[index] == digit else 0
+        row_slot, col_slot, box_slot = self._slots(index, digit)
+        return self.row_counts[row_slot] == own and self.col_counts[col_slot] == own \
+            and self.box_counts[box_slot] == own
+
+    def is_complete(self):
+        return self.filled == self.size * self.size
+
+    def is_solved(self):
+        return self.is_complete() and not self.conflicts
+
+
+class SolveStats:
+    """Counters a solver updates while it runs"""
+
+    def __init__(self):
+        self.iterations = 0
+        self.elapsed_time = 0.0
+        self.memory_used = 0.0  # MB allocated since the solve began (net)
+        self.peak_memory = 0.0  # MB at the high-water mark
+        self.fitness = 0
+        self.progress = 0.0
+        self.truncated = False  # the search gave up on its node budget
+        self.start_time = time.perf_counter()
+
+    def to_dict(self):
+        return {
+            "iterations": self.iterations,
+            "elapsed_time": self.elapsed_time,
+            "memory_used": self.memory_used,
+            "peak_memory": self.peak_memory,
+            "fitness": self.fitness,
+        }
+
+
+MB = 1024 * 1024
+
+
+class MemoryMeter:
+    """Measures nothing; the base for the meters below.
+
+    A meter is started when a solve begins and stopped when it ends. current()
+    is called from the solver's thread on every progress report, so it must
+    never make a syscall or walk the heap.
+    """
+
+    name = "none"
+
+    def start(self):
+        pass
+
+    def current(self):
+        """Net MB allocated since start()"""
+        return 0.0
+
+    def stop(self):
+        """Return (peak, net) MB for the whole solve"""
+        return 0.0, 0.0
+
+
+class SampledRSSMeter(MemoryMeter):
+    """Process RSS read by a background thread every 'interval' seconds, so the
+    solver never pays for the syscall. Solves shorter than the interval only
+    see the readings taken at start and stop. Needs psutil; without it every
+    reading is 0."""
+
+    name = "rss"
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self._process = psutil.Process() if psutil is not None else None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._baseline = self._latest = self._peak = 0
+
+    def _rss(self):
+        return self._process.memory_info().rss if self._process is not None else 0
+
+    def _sample_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self._latest = self._rss()
+            self._peak = max(self._peak, self._latest)
+
+    def start(self):
+        self._baseline = self._latest = self._peak = self._rss()
+        if self._process is not None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._sample_loop, name="rss-sampler", daemon=True)
+            self._thread.start()
+
+    def current(self):
+        return (self._latest - self._baseline) / MB
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self._latest = self._rss()
+        self._peak = max(self._peak, self._latest)
+        return (self._peak - self._baseline) / MB, (self._latest - self._baseline) / MB
+
+
+class TracemallocMeter(MemoryMeter):
+    """Python allocations made during the solve, tracked by tracemalloc. Peak
+    and net are exact and ignore other threads' unrelated RSS, but tracing
+    makes every allocation slower, so use it for memory runs, not timing."""
+
+    name = "tracemalloc"
+
+    def __init__(self):
+        self._started_tracing = False
+        self._baseline = 0
+
+    def start(self):
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def current(self):
+        return (tracemalloc.get_traced_memory()[0] - self._baseline) / MB
+
+    def stop(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+        return (peak - self._baseline) / MB, (current - self._baseline) / MB
+
+
+#memory meters by the name SolverControl(memory=...) and the command-line tools accept
+MEMORY_METERS: Dict[str, Callable[[], MemoryMeter]] = {
+    "none": MemoryMeter,
+    "rss": SampledRSSMeter,
+    "tracemalloc": TracemallocMeter,
+}
+
+
+class SolverControl:
+    """Lets a caller stop a running solver and receive progress reports.
+
+    on_progress is called from the solver's thread with the live SolveStats.
+    memory picks how memory is measured: a MEMORY_METERS name or a MemoryMeter.
+    The default samples RSS off-thread when psutil is installed.
+
+    With checkpoint_path set, the RESUMABLE solvers write their state there
+    every checkpoint_interval seconds and once more if they are stopped;
+    resume_solve(read_checkpoint(path)) carries on from it.
+
+    time_budget (seconds from the start of each solve) and iteration_budget
+    (search nodes, or generations for the genetic solvers) make every solve an
+    anytime one: should_stop() turns true once either runs out, the solver
+    hands back the best board it has, and the SolveResult is marked "timeout".
+    """
+
+    def __init__(self, on_progress: Optional[Callable[[SolveStats], None]] = None, memory=None,
+                 checkpoint_path=None, checkpoint_interval=60.0, time_budget=None, iteration_budget=None):
+        self.on_progress = on_progress
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.time_budget = time_budget
+        self.iteration_budget = iteration_budget
+        self.expired = False  # the current solve ran out of its time or iteration budget
+        self._deadline = None
+        self._stats = None
+        self._next_checkpoint = 0.0
+        self._algorithm = None
+        self._puzzle = None
+        self._stop_event = threading.Event()
+        if memory is None:
+            memory = "rss" if psutil is not None else "none"
+        if isinstance(memory, str):
+            if memory not in MEMORY_METERS:
+                raise ValueError(f"Unknown memory meter {memory!r}; expected one of {sorted(MEMORY_METERS)}")
+            memory = MEMORY_METERS[memory]()
+        self.memory = memory
+
+    def stop(self):
+        self._stop_event.set()
+
+    def should_stop(self):
+        """True once stop() was called or the budget is spent. Cheap enough to
+        call every few search nodes: an Event check and, with a time budget,
+        one clock read"""
+        return self._stop_event.is_set() or self.over_budget()
+
+    def over_budget(self):
+        """True once the time or iteration budget is spent (stop() aside). Solvers
+        check this where stopping would leave a state that resumes differently
+        from an uninterrupted run, which is fine once time is up but not for a
+        plain pause"""
+        if self.expired:
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.expired = True
+        elif self.iteration_budget is not None and self._stats is not None \
+                and self._stats.iterations >= self.iteration_budget:
+            self.expired = True
+        return self.expired
+
+    def remaining_time(self):
+        """Seconds left of the time budget (None without one), for handing a
+        share of it to work done elsewhere"""
+        return None if self._deadline is None else max(0.0, self._deadline - time.monotonic())
+
+    def begin(self, stats, algorithm=None, puzzle=None):
+        self.memory.start()
+        stats.start_time = time.perf_counter()
+        self._stats = stats
+        self.expired = False
+        self._deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+        self._algorithm = algorithm
+        self._puzzle = puzzle
+        self._next_checkpoint = time.monotonic() + self.checkpoint_interval
+
+    def checkpoint_due(self):
+        return self.checkpoint_path is not None and time.monotonic() >= self._next_checkpoint
+
+    def checkpoint(self, stats, state):
+        """Write the solver's 'state' to checkpoint_path, with what is needed to resume it"""
+        if self.checkpoint_path is None:
+            return
+        write_checkpoint(self.checkpoint_path, {
+            "format": CHECKPOINT_FORMAT,
+            "algorithm": self._algorithm,
+            "puzzle": self._puzzle.flatten(),
+            "layout": [self._puzzle.size, self._puzzle.box_size_rows, self._puzzle.box_size_cols],
+            "iterations": stats.iterations,
+            "elapsed_time": time.perf_counter() - stats.start_time,
+            "state": state,
+        })
+        self._next_checkpoint = time.monotonic() + self.checkpoint_interval
+
+    def update(self, stats):
+        stats.elapsed_time = time.perf_counter() - stats.start_time
+        stats.memory_used = self.memory.current()
+        stats.peak_memory = max(stats.peak_memory, stats.memory_used)
+
+    def finish(self, stats):
+        """Final time and memory figures once the solver has returned"""
+        stats.elapsed_time = time.perf_counter() - stats.start_time
+        stats.peak_memory, stats.memory_used = self.memory.stop()
+
+    def report(self, stats):
+        """Refresh time/memory and hand the stats to the progress callback"""
+        if self.on_progress is None:
+            return
+        self.update(stats)
+        self.on_progress(stats)
+
+
+class StatsChannel:
+    """Carries progress from a solver thread to a reader that polls at its own pace.
+
+    Pass it to SolverControl as on_progress. Each report overwrites the snapshot
+    that hasn't been read yet (latest value wins), so the channel never holds
+    more than one and a fast solver costs the reader nothing extra; the solver
+    only takes a lock and copies a few numbers. finish() hands over the
+    SolveResult once the run is over. Nothing here touches a GUI toolkit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = None
+        self._result = None
+        self.dropped = 0  # snapshots overwritten before anyone read them
+
+    def __call__(self, stats):
+        snapshot = stats.to_dict()
+        snapshot["progress"] = stats.progress
+        with self._lock:
+            if self._latest is not None:
+                self.dropped += 1
+            self._latest = snapshot
+
+    def finish(self, result):
+        with self._lock:
+            self._result = result
+
+    def drain(self):
+        """Return (latest stats snapshot or None, SolveResult or None), emptying the channel"""
+        with self._lock:
+            latest, result = self._latest, self._result
+            self._latest = self._result = None
+        return latest, result
+
+
+#bumped whenever the checkpoint layout changes
+CHECKPOINT_FORMAT = 1
+
+
+def write_checkpoint(path, checkpoint):
+    """Save a checkpoint dict as gzipped JSON. The file is replaced atomically,
+    so a crash mid-write leaves the previous checkpoint intact"""
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, "wt", encoding="utf-8") as out:
+        json.dump(checkpoint, out, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def read_checkpoint(path):
+    with gzip.open(path, "rt", encoding="utf-8") as source:
+        checkpoint = json.load(source)
+    if checkpoint.get("format") != CHECKPOINT_FORMAT:
+        raise ValueError(f"{path} is not a format {CHECKPOINT_FORMAT} checkpoint")
+    return checkpoint
+
+
+def rng_state(rng):
+    """rng.getstate() as JSON-friendly lists"""
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def set_rng_state(rng, state):
+    version, internal, gauss_next = state
+    rng.setstate((version, tuple(internal), gauss_next))
+
+
+#what a SolveResult's board is: a verified solution, the best board of a run
+#that ran out of its budget, or the best board of a run that ended any other way
+RESULT_STATUSES = ("proven", "timeout", "partial")
+
+
+class SolveResult:
+    """What solve() returns: the final board, whether it is a valid solution,
+    its status (one of RESULT_STATUSES), and stats"""
+
+    def __init__(self, board, solved, stats, algorithm, status=None):
+        self.board = board
+        self.solved = solved
+        self.stats = stats
+        self.algorithm = algorithm
+        self.status = status or ("proven" if solved else "partial")
+
+    def to_dict(self):
+        result = {
+            "algorithm": self.algorithm,
+            "solved": self.solved,
+            "status": self.status,
+            "solution": self.board.flatten() if self.board is not None else None,
+        }
+        result.update(self.stats.to_dict())
+        return result
+
+
+class BacktrackingSearch:
+    """Plain backtracking in row-major order, trying digits with
+    is_valid_placement().
+
+    The search runs on an explicit stack of [cell index, next digit] frames
+    rather than recursion, so 25×25 boards cannot hit the recursion limit, and
+    run() can stop part-way and pick up again. checkpoint() captures the
+    board and the stack.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.cells = board.copy().cells
+        self.stack = []
+        self.descend = True
+        self.finished = False
+        self.solution = None
+
+    def run(self, stats, control, max_nodes=None):
+        """Search until solved, exhausted, stopped or 'max_nodes' more nodes
+        have been visited. Returns True once the search is finished"""
+        board = self.board
+        size = board.size
+        cells = self.cells
+        stack = self.stack
+        descend = self.descend
+        budget = None if max_nodes is None else stats.iterations + max_nodes
+
+        while not self.finished:
+            if descend:
+                if control.should_stop() or stats.iterations == budget:
+                    break
+
+                stats.iterations += 1
+
+                #report progress every 10 moves/iterations
+                if stats.iterations % 10 == 0:
+                    stats.progress = min(99, (stats.iterations / 10000) * 100)
+                    control.report(stats)
+
+                #find an empty cell
+                index = cells.find(0)
+                if index < 0:
+                    #board is full (no empty cell found), solution is found
+                    self.solution = SudokuBoard(size, board.box_size_rows, board.box_size_cols, cells)
+                    self.finished = True
+                    break
+                stack.append([index, 1])
+
+            frame = stack[-1]
+            index, num = frame
+            row, col = divmod(index, size)
+            cells[index] = 0
+            while num <= size and not is_valid_placement(cells, row, col, num, size,
+                                                         board.box_size_rows, board.box_size_cols):
+                num += 1
+
+            if num > size:
+                #this path didn't work, so we backtrack
+                stack.pop()
+                if not stack:
+                    self.finished = True
+                    break
+                descend = False
+                continue
+
+            cells[index] = num
+            frame[1] = num + 1
+            descend = True
+
+        self.descend = descend
+        return self.finished
+
+    def checkpoint(self):
+        return {"cells": encode_cells(self.cells), "stack": self.stack, "descend": self.descend}
+
+    @classmethod
+    def restore(cls, board, state):
+        search = cls(board)
+        search.cells = decode_cells(state["cells"])
+        search.stack = state["stack"]
+        search.descend = state["descend"]
+        return search
+
+
+#search nodes between checks for a due checkpoint
+CHECKPOINT_NODES = 65536
+
+
+def run_resumable(search, stats, control):
+    """Run a resumable search to the end. With a checkpoint path set it pauses
+    every CHECKPOINT_NODES nodes to write a checkpoint when one is due, and
+    writes a last one if the run is stopped"""
+    budget = CHECKPOINT_NODES if control.checkpoint_path is not None else None
+    while not search.run(stats, control, budget):
+        if control.should_stop():
+            control.checkpoint(stats, search.checkpoint())
+            return
+        if control.checkpoint_due():
+            control.checkpoint(stats, search.checkpoint())
+
+
+def solve_backtracking(board, stats, control, resume=None):
+    """Plain backtracking (see BacktrackingSearch). Returns the solved board, the
+    partial board reached if it was stopped, or None if there is no solution"""
+    #clashing givens would otherwise send it through the whole search tree
+    if not BitmaskGrid(board).consistent:
+        return None
+    search = BacktrackingSearch(board) if resume is None else BacktrackingSearch.restore(board, resume)
+    run_resumable(search, stats, control)
+    if not search.finished:
+        return SudokuBoard(board.size, board.box_size_rows, board.box_size_cols, search.cells)
+    return search.solution
+
+
+#how many search nodes pass between progress reports
+REPORT_INTERVAL = 1024
+#how many pass between stop checks, which also enforce the time budget; a
+#25×25 MRV node can take ~100 µs, so REPORT_INTERVAL would overshoot it badly
+STOP_CHECK_INTERVAL = 64
+
+
+class BitmaskGrid:
+    """Flat board plus per-row, per-column and per-box bitmasks of used digits.
+
+    Digit n is bit (n - 1). place() and remove() keep the masks in sync in O(1),
+    and candidates() is a single OR/AND. empty holds the indices that were
+    empty when the grid was built, in row-major order.
+    """
+
+    def __init__(self, board):
+        size = board.size
+        self.size = size
+        self.box_size_rows = board.box_size_rows
+        self.box_size_cols = board.box_size_cols
+        self.full_mask = (1 << size) - 1
+        self.row_of = [i // size for i in range(size * size)]
+        self.col_of = [i % size for i in range(size * size)]
+        self.box_of = box_table(size, board.box_size_rows, board.box_size_cols)
+        self.row_used = [0] * size
+        self.col_used = [0] * size
+        self.box_used = [0] * (self.box_of[-1] + 1)
+        self.cells = bytearray(board.cells)
+        self.empty = []
+        self.consistent = True
+
+        for index, num in enumerate(self.cells):
+            if num == 0:
+                self.empty.append(index)
+                continue
+            bit = 1 << (num - 1)
+            if not self.candidates(index) & bit:
+                self.consistent = False  # the givens already clash
+            self.place(index, bit)
+
+    def candidates(self, index):
+        """Bitmask of digits that can still go in cell 'index'"""
+        return ~(self.row_used[self.row_of[index]] | self.col_used[self.col_of[index]]
+                 | self.box_used[self.box_of[index]]) & self.full_mask
+
+    def place(self, index, bit):
+        self.row_used[self.row_of[index]] |= bit
+        self.col_used[self.col_of[index]] |= bit
+        self.box_used[self.box_of[index]] |= bit
+        self.cells[index] = bit.bit_length()
+
+    def remove(self, index, bit):
+        self.row_used[self.row_of[index]] ^= bit
+        self.col_used[self.col_of[index]] ^= bit
+        self.box_used[self.box_of[index]] ^= bit
+        self.cells[index] = 0
+
+    def to_board(self, board):
+        """Copy the grid back into a SudokuBoard shaped like 'board'"""
+        return SudokuBoard(self.size, board.box_size_rows, board.box_size_cols, self.cells)
+
+
+class IterativeSearch:
+    """Depth-first search over a BitmaskGrid on an explicit stack.
+
+    Depth k holds one compact frame: the cell being filled, grid.empty[k],
+    and remaining[k], the bitmask of its candidates not tried yet (placed[k]
+    is the one currently on the grid). No Python frame is pushed per node, so
+    the depth is only bounded by the number of empty cells, and run() can
+    return part-way (node budget or stop request) and be called again later to
+    carry on exactly where it paused.
+
+    With mrv each new depth branches on the open cell with the fewest
+    candidates, or, when every open cell has two or more, on a hidden single
+    (a digit with only one place left in some row, column or box, which is
+    then the cell's only candidate). A placement is dropped as soon as one of
+    its peers runs out of candidates (forward checking), and a node where some
+    unit has no place left for a digit is a dead end. Without mrv cells are
+    filled in row-major order, like a plain backtracker.
+    """
+
+    def __init__(self, grid, limit=1, mrv=True):
+        self.grid = grid
+        self.limit = limit
+        self.mrv = mrv
+        self.remaining = [0] * len(grid.empty)
+        self.placed = [0] * len(grid.empty)
+        self.depth = 0
+        self.descending = True  # the frame at 'depth' has not been opened yet
+        self.finished = False
+        self.nodes = 0
+        self.solutions = []
+
+    def run(self, stats=None, control=None, max_nodes=None):
+        """Search until finished, until 'max_nodes' more nodes have been
+        visited, or until control asks to stop. Returns True once the search is
+        finished ('limit' solutions found or the tree exhausted)."""
+        if self.finished:
+            return True
+        if stats is None:
+            stats = SolveStats()
+        grid = self.grid
+        empty = grid.empty
+        total = len(empty)
+        row_used, col_used, box_used = grid.row_used, grid.col_used, grid.box_used
+        row_of, col_of, box_of = grid.row_of, grid.col_of, grid.box_of
+        full_mask = grid.full_mask
+        cells = grid.cells
+        remaining, placed = self.remaining, self.placed
+        mrv = self.mrv
+        peers = peer_table(grid.size, grid.box_size_rows, grid.box_size_cols)
+        #only units holding every digit can have hidden singles (not the 1×1 boxes of 3×3)
+        units = [unit for unit in unit_table(grid.size, grid.box_size_rows, grid.box_size_cols)
+                 if len(unit) == grid.size]
+        open_candidates = [0] * len(cells)  # filled in by the MRV scan, read by the hidden-single scan
+        depth, descending, nodes = self.depth, self.descending, self.nodes
+        budget = None if max_nodes is None else nodes + max_nodes
+        finished = False
+
+        while True:
+            if descending:
+                if depth == total:
+                    self.solutions.append(bytearray(cells))
+                    if len(self.solutions) >= self.limit or total == 0:
+                        finished = True
+                        break
+                    depth -= 1
+                    descending = False
+                    continue
+
+                if nodes == budget:
+                    break
+                if control is not None and (nodes + 1) % STOP_CHECK_INTERVAL == 0:
+                    if control.should_stop():
+                        break
+                    if (nodes + 1) % REPORT_INTERVAL == 0:
+                        stats.progress = min(99, depth / total * 100)
+                        control.report(stats)
+                nodes += 1
+                stats.iterations += 1
+
+                if mrv:
+                    #pick the open cell with the fewest candidates and move it to slot 'depth'
+                    best_j, best_count, mask = depth, full_mask.bit_count() + 1, 0
+                    for j in range(depth, total):
+                        index = empty[j]
+                        candidates = ~(row_used[row_of[index]] | col_used[col_of[index]]
+                                       | box_used[box_of[index]]) & full_mask
+                        open_candidates[index] = candidates
+                        count = candidates.bit_count()
+                        if count < best_count:
+                            best_j, best_count, mask = j, count, candidates
+                            if count <= 1:
+                                break
+                    if best_count > 1:
+                        #no naked single: look for a digit with one place left in a unit
+                        for unit in units:
+                            once = twice = used = 0
+                            for index in unit:
+                                digit = cells[index]
+                                if digit:
+                                    used |= 1 << (digit - 1)
+                                else:
+                                    candidates = open_candidates[index]
+                                    twice |= once & candidates
+                                    once |= candidates
+                            if (once | used) != full_mask:
+                                mask = 0  # some digit has nowhere to go in this unit
+                                break
+                            singles = once & ~twice
+                            if singles:
+                                bit = singles & -singles
+                                for index in unit:
+                                    if cells[index] == 0 and open_candidates[index] & bit:
+                                        best_j, mask = empty.index(index, depth), bit
+                                        break
+                                break
+                    empty[depth], empty[best_j] = empty[best_j], empty[depth]
+                else:
+                    index = empty[depth]
+                    mask = ~(row_used[row_of[index]] | col_used[col_of[index]]
+                             | box_used[box_of[index]]) & full_mask
+                remaining[depth] = mask
+                placed[depth] = 0
+                descending = False
+
+            #take back this depth's current digit and try its next candidate
+            index = empty[depth]
+            r, c, b = row_of[index], col_of[index], box_of[index]
+            bit = placed[depth]
+            if bit:
+                row_used[r] ^= bit
+                col_used[c] ^= bit
+                box_used[b] ^= bit
+                placed[depth] = 0
+            mask = remaining[depth]
+            if not mask:
+                cells[index] = 0
+                if depth == 0:
+                    finished = True
+                    break
+                depth -= 1
+                continue
+
+            bit = mask & -mask
+            remaining[depth] = mask ^ bit
+            row_used[r] |= bit
+            col_used[c] |= bit
+            box_used[b] |= bit
+            cells[index] = bit.bit_length()
+            placed[depth] = bit
+
+            if mrv:
+                #forward checking: every still-empty peer needs at least one candidate left
+                for peer in peers[index]:
+                    if cells[peer] == 0 and not (~(row_used[row_of[peer]] | col_used[col_of[peer]]
+                                                   | box_used[box_of[peer]]) & full_mask):
+                        break
+                else:
+                    depth += 1
+                    descending = True
+            else:
+                depth += 1
+                descending = True
+
+        self.depth, self.descending, self.nodes = depth, descending, nodes
+        self.finished = finished
+        return finished
+
+    def checkpoint(self):
+        return {
+            "limit": self.limit,
+            "mrv": self.mrv,
+            "empty": self.grid.empty,
+            "remaining": self.remaining,
+            "placed": self.placed,
+            "depth": self.depth,
+            "descending": self.descending,
+            "nodes": self.nodes,
+            "solutions": [encode_cells(solution) for solution in self.solutions],
+        }
+
+    @classmethod
+    def restore(cls, grid, state):
+        """Rebuild a search from checkpoint() on a fresh BitmaskGrid of the same puzzle"""
+        search = cls(grid, state["limit"], state["mrv"])
+        grid.empty[:] = state["empty"]
+        search.remaining = state["remaining"]
+        search.placed = state["placed"]
+        search.depth = state["depth"]
+        search.descending = state["descending"]
+        search.nodes = state["nodes"]
+        search.solutions = [decode_cells(text) for text in state["solutions"]]
+        for k, bit in enumerate(search.placed):
+            if bit:
+                grid.place(grid.empty[k], bit)
+        return search
+
+    def unwind(self):
+        """Take every placement back off the grid; the search cannot resume after this"""
+        grid = self.grid
+        for k, bit in enumerate(self.placed):
+            if bit:
+                grid.remove(grid.empty[k], bit)
+                self.placed[k] = 0
+        self.finished = True
+
+
+def solve_search(board, stats, control, mrv, resume=None):
+    """Run an IterativeSearch for one solution. Returns the solved board, the
+    partial board reached if it was stopped, or None if there is no solution"""
+    grid = BitmaskGrid(board)
+    if not grid.consistent:
+        return None
+    search = IterativeSearch(grid, 1, mrv) if resume is None else IterativeSearch.restore(grid, resume)
+    run_resumable(search, stats, control)
+    if not search.solutions:
+        if not search.finished:
+            return SudokuBoard(board.size, board.box_size_rows, board.box_size_cols, grid.cells)
+        return None
+    return SudokuBoard(board.size, board.box_size_rows, board.box_size_cols, search.solutions[0])
+
+
+def solve_bitmask(board, stats, control, resume=None):
+    """Row-major backtracking on a BitmaskGrid. Returns the solved board or None"""
+    return solve_search(board, stats, control, False, resume)
+
+
+@functools.lru_cache(maxsize=None)
+def peer_table(size, box_size_rows, box_size_cols):
+    """For every flat cell index, the indices of the other cells in its row, column and box"""
+    box_of = box_table(size, box_size_rows, box_size_cols)
+    cell_count = size * size
+    return tuple(
+        tuple(other for other in range(cell_count) if other != index and
+              (other // size == index // size or other % size == index % size or box_of[other] == box_of[index]))
+        for index in range(cell_count))
+
+
+def mrv_search(grid, limit=1, stats=None, control=None, node_limit=None):
+    """Search a BitmaskGrid, always branching on the cell with the fewest
+    candidates (MRV) and pruning a branch as soon as a peer of the placed cell
+    runs out of candidates (forward checking).
+
+    Returns up to 'limit' solutions as flat bytearrays; the grid is left as it
+    was. With limit=2 this doubles as a fast uniqueness check. If node_limit
+    nodes are visited first, the search gives up and sets stats.truncated.
+    """
+    if stats is None:
+        stats = SolveStats()
+    search = IterativeSearch(grid, limit)
+    if not search.run(stats, control, node_limit) and search.nodes == node_limit:
+        stats.truncated = True
+    search.unwind()
+    return search.solutions
+
+
+def solve_mrv(board, stats, control, resume=None):
+    """MRV + forward-checking backtracking (see IterativeSearch). Returns the solved board or None"""
+    return solve_search(board, stats, control, True, resume)
+
+
+class DancingLinks:
+    """Knuth's Algorithm X on a dancing-links matrix stored in flat int lists.
+
+    Node 0 is the root, nodes 1..primary + secondary are column headers and the
+    rest are the 1s of the matrix. Secondary columns are never linked into the
+    header ring, so they may be covered at most once but need not be covered.
+    """
+
+    def __init__(self, primary_columns, secondary_columns=0):
+        columns = primary_columns + secondary_columns
+        self.left = list(range(-1, columns))
+        self.right = list(range(1, columns + 2))
+        self.left[0] = primary_columns
+        self.right[primary_columns] = 0
+        for header in range(primary_columns + 1, columns + 1):
+            self.left[header] = self.right[header] = header
+        self.up = list(range(columns + 1))
+        self.down = list(range(columns + 1))
+        self.column = list(range(columns + 1))
+        self.row_id = [-1] * (columns + 1)
+        self.count = [0] * (columns + 1)
+        self.covered = [False] * (columns + 1)
+
+    def add_row(self, row_id, columns):
+        """Add a matrix row with 1s in the given (0-based) columns"""
+        first = len(self.column)
+        for offset, col in enumerate(columns):
+            header = col + 1
+            node = first + offset
+            self.column.append(header)
+            self.row_id.append(row_id)
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.count[header] += 1
+            self.left.append(node - 1 if offset else first + len(columns) - 1)
+            self.right.append(node + 1 if offset < len(columns) - 1 else first)
+        return first
+
+    def cover(self, header):
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        self.covered[header] = True
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                count[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, header):
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                count[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+        self.covered[header] = False
+
+    def select(self, node):
+        """Commit to the row holding 'node'. False if it clashes with an earlier selection"""
+        j = node
+        while True:
+            if self.covered[self.column[j]]:
+                return False
+            j = self.right[j]
+            if j == node:
+                break
+        j = node
+        while True:
+            self.cover(self.column[j])
+            j = self.right[j]
+            if j == node:
+                break
+        return True
+
+    def search(self, limit=1, stats=None, control=None):
+        """Return (solutions, partial): up to 'limit' exact covers, each a list
+        of row ids, and, if control stopped the search, the rows chosen so far
+        (None otherwise).
+
+        'chosen' holds the node picked at each level, so the search is a loop
+        rather than one Python call per level. The matrix is left as it was.
+        """
+        partial = None
+        left, right, down, column, count, row_id = self.left, self.right, self.down, self.column, self.count, self.row_id
+        solutions = []
+        chosen = []
+        descend = True
+
+        while True:
+            if descend:
+                if right[0] == 0:
+                    solutions.append([row_id[r] for r in chosen])
+                    if len(solutions) >= limit:
+                        break
+                    descend = False
+                else:
+                    if stats is not None:
+                        stats.iterations += 1
+                        if stats.iterations % STOP_CHECK_INTERVAL == 0 and control is not None:
+                            if control.should_stop():
+                                partial = [row_id[r] for r in chosen]
+                                break
+                            if stats.iterations % REPORT_INTERVAL == 0:
+                                control.report(stats)
+
+                    #choose the column with the fewest rows left (S heuristic)
+                    header, best = right[0], count[right[0]]
+                    c = right[header]
+                    while c != 0 and best > 1:
+                        if count[c] < best:
+                            header, best = c, count[c]
+                        c = right[c]
+                    if best == 0:
+                        descend = False
+                    else:
+                        self.cover(header)
+                        r = down[header]
+                        chosen.append(r)
+                        j = right[r]
+                        while j != r:
+                            self.cover(column[j])
+                            j = right[j]
+                        continue
+
+            #backtrack: move the deepest choice on to the next row of its column
+            if not chosen:
+                break
+            r = chosen.pop()
+            j = left[r]
+            while j != r:
+                self.uncover(column[j])
+                j = left[j]
+            header = column[r]
+            r = down[r]
+            if r == header:
+                self.uncover(header)
+                continue
+            chosen.append(r)
+            j = right[r]
+            while j != r:
+                self.cover(column[j])
+                j = right[j]
+            descend = True
+
+        #undo whatever is still selected
+        while chosen:
+            r = chosen.pop()
+            j = left[r]
+            while j != r:
+                self.uncover(column[j])
+                j = left[j]
+            self.uncover(column[r])
+        return solutions, partial
+
+
+def build_exact_cover(board):
+    """Sudoku as exact cover: one matrix row per (cell, digit) with columns for
+    cell, row-digit, column-digit and box-digit. Box columns are secondary when
+    the boxes are smaller than a row (e.g. the 1×1 boxes of the 3×3 board).
+    Returns (links, node_of) where node_of[row_id] is the first node of that row,
+    or (None, None) if the givens already conflict."""
+    size = board.size
+    area = size * size
+    box_of = box_table(size, board.box_size_rows, board.box_size_cols)
+    box_count = box_of[-1] + 1
+    full_boxes = board.box_size_rows * board.box_size_cols == size
+    if full_boxes:
+        links = DancingLinks(3 * area + box_count * size)
+    else:
+        links = DancingLinks(3 * area, box_count * size)
+
+    node_of = {}
+    for r in range(size):
+        for c in range(size):
+            b = box_of[r * size + c]
+            given = board.cells[r * size + c]
+            for d in range(size):
+                if given and given != d + 1:
+                    continue
+                row_id = (r * size + c) * size + d
+                node_of[row_id] = links.add_row(row_id, (
+                    r * size + c,
+                    area + r * size + d,
+                    2 * area + c * size + d,
+                    3 * area + b * size + d,
+                ))
+
+    #commit to the givens up front (a given outside 1..size has no row at all)
+    for index, given in enumerate(board.cells):
+        if given and (given > size or not links.select(node_of[index * size + given - 1])):
+            return None, None
+    return links, node_of
+
+
+def cover_to_board(board, row_ids):
+    solution = board.copy()
+    for row_id in row_ids:
+        index, d = divmod(row_id, board.size)
+        solution.cells[index] = d + 1
+    return solution
+
+
+def solve_dlx(board, stats, control):
+    """Dancing Links exact-cover solver. Returns the solved board, the partial
+    board reached if it was stopped, or None if there is no solution"""
+    links, _ = build_exact_cover(board)
+    if links is None:
+        return None
+    solutions, partial = links.search(1, stats, control)
+    if not solutions:
+        #stopped part-way: hand back the consistent part of the board it had filled
+        return None if partial is None else cover_to_board(board, partial)
+    return cover_to_board(board, solutions[0])
+
+
+def count_solutions(board, limit=2, node_limit=None):
+    """Count solutions of 'board', stopping once 'limit' are found.
+
+    Uses the bitmask MRV search, which is cheaper to set up than the DLX
+    matrix when it is called once per removed clue by the generator.
+    Returns None if node_limit search nodes were not enough to tell."""
+    grid = BitmaskGrid(board)
+    if not grid.consistent:
+        return 0
+    stats = SolveStats()
+    solutions = mrv_search(grid, limit, stats, node_limit=node_limit)
+    if stats.truncated:
+        return None
+    return len(solutions)
+
+
+def has_other_solution(board, index, value, node_limit=None):
+    """Whether emptying cell 'index' (which held 'value') of a board whose solution was
+    unique lets in a second one.
+
+    Any second solution must put another digit in that cell, or it would have
+    been a second solution before, so only those branches are searched. Each
+    one starts with the cell fixed, which is far cheaper than proving
+    uniqueness from scratch with count_solutions(). Returns None if node_limit
+    nodes (shared by the branches) were not enough to tell.
+    """
+    stats = SolveStats()
+    trial = board.copy()
+    for digit in board.get_valid_numbers(*divmod(index, board.size)):
+        if digit == value:
+            continue
+        trial.cells[index] = digit
+        grid = BitmaskGrid(trial)
+        left = None if node_limit is None else node_limit - stats.iterations
+        if mrv_search(grid, 1, stats, node_limit=left):
+            return True
+        if stats.truncated:
+            return None
+    return False
+
+
+#GeneticSolver methods a PhaseProfiler times, and the phase name each is reported under
+GA_PHASES = {
+    "start": "initialize",
+    "step": "generation",
+    "select_parent": "selection",
+    "mate_2d": "mating",
+    "evaluate": "fitness",
+    "rank": "sort",
+    "inject_diversity": "diversity",
+    "create_gnome_2d": "create_gnome",
+}
+
+
+class PhaseProfiler:
+    """Cumulative time and call counts per phase of a solver.
+
+    instrument() wraps the named methods of one solver object with timers, so
+    a solver built without a profiler runs the plain methods and pays nothing.
+    Phases nest: time spent in 'fitness' while inside 'diversity' is recorded
+    under the path generation;diversity;fitness. Every call of the phase named
+    by 'round_phase' (a GA generation) also gets its own per-phase breakdown.
+    """
+
+    def __init__(self, round_phase="generation"):
+        self.round_phase = round_phase
+        self.totals = {}  # path -> [calls, total seconds, seconds spent in child phases]
+        self.rounds = []  # one {phase: seconds} dict per round_phase call
+        self._stack = []  # [path, start, child seconds] for each open phase
+        self._round = collections.Counter()
+
+    def instrument(self, obj, phases):
+        """Time obj's methods: 'phases' maps method name -> phase name"""
+        for method, phase in phases.items():
+            setattr(obj, method, self._timed(phase, getattr(obj, method)))
+
+    def _timed(self, phase, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            self.enter(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.exit()
+        return timed
+
+    def enter(self, phase):
+        path = self._stack[-1][0] + (phase,) if self._stack else (phase,)
+        self._stack.append([path, time.perf_counter(), 0.0])
+
+    def exit(self):
+        path, start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        entry = self.totals.setdefault(path, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+            if len(path) == 2 and path[0] == self.round_phase:
+                self._round[path[1]] += elapsed
+        elif path == (self.round_phase,):
+            self.rounds.append(dict(self._round, total=elapsed))
+            self._round.clear()
+
+    def to_dict(self):
+        """Totals per phase path and the per-round breakdown, ready for json.dump"""
+        return {
+            "phases": [{"path": ";".join(path), "calls": calls, "total": total, "self": total - children}
+                       for path, (calls, total, children) in sorted(self.totals.items())],
+            self.round_phase + "s": self.rounds,
+        }
+
+    def folded(self):
+        """Self time per phase path in folded-stack format (one 'a;b;c microseconds'
+        line per path), as read by flamegraph.pl and speedscope"""
+        return "".join(f"{';'.join(path)} {round((total - children) * 1e6)}\n"
+                       for path, (calls, total, children) in sorted(self.totals.items()))
+
+    def summary(self):
+        """Human-readable table of the phases, children indented under their parent"""
+        grand_total = sum(total for path, (_, total, _) in self.totals.items() if len(path) == 1) or 1.0
+        lines = [f"{'phase':<32} {'calls':>9} {'total s':>10} {'self s':>10} {'%':>6} {'per call':>12}"]
+        for path, (calls, total, children) in sorted(self.totals.items()):
+            name = "  " * (len(path) - 1) + path[-1]
+            lines.append(f"{name:<32} {calls:>9} {total:>10.4f} {total - children:>10.4f}"
+                         f" {total / grand_total:>6.1%} {total / calls * 1e6:>10.1f}us")
+        return "\n".join(lines)
+
+
+def population_fitness(population, original, box_size_rows, box_size_cols, rows_fixed=False):
+    """calculate_fitness_2d for a whole (N, size, size) uint8 array at once.
+
+    Duplicates in a row/column/box are counted from per-digit tallies: a digit
+    seen k > 0 times adds k - 1, which is what the set-based loop adds too.
+    With rows_fixed (every row a permutation that keeps the clues) only the
+    column and box terms can be non-zero, so the rest is skipped.
+    """
+    n, size = population.shape[0], population.shape[1]
+    digits = np.arange(1, size + 1, dtype=population.dtype)
+    onehot = population[..., None] == digits  # (N, size, size, digits)
+
+    fitness = np.maximum(onehot.sum(axis=1) - 1, 0).sum(axis=(1, 2))  # columns
+    boxes = onehot.reshape(n, size // box_size_rows, box_size_rows,
+                           size // box_size_cols, box_size_cols, size).sum(axis=(2, 4))
+    fitness += np.maximum(boxes - 1, 0).sum(axis=(1, 2, 3))
+    if rows_fixed:
+        return fitness
+
+    fitness += 10 * np.count_nonzero(population == 0, axis=(1, 2))
+    fitness += np.maximum(onehot.sum(axis=2) - 1, 0).sum(axis=(1, 2))  # rows
+    fitness += 5 * np.count_nonzero((original != 0) & (population != original), axis=(1, 2))
+    return fitness
+
+
+class GeneticSolver:
+    """Genetic algorithm over full boards (lower fitness is better).
+
+    A chromosome is a flat bytearray laid out like SudokuBoard.cells, so
+    copying one is a memcpy and a generation can be handed to NumPy with a
+    single bytes join.
+    """
+
+    rows_fixed = False  # True when every chromosome row is already a valid permutation
+
+    def __init__(self, board, stats, control, rng=None, vectorized=True, profiler=None):
+        self.size = board.size
+        self.box_size_rows = board.box_size_rows
+        self.box_size_cols = board.box_size_cols
+        self.original_board = bytes(board.cells)
+        self.stats = stats
+        self.control = control
+        self.rng = rng if rng is not None else random
+        #score whole generations with NumPy when it is installed
+        self.vectorized = vectorized and np is not None and self.size % self.box_size_rows == 0 \
+            and self.size % self.box_size_cols == 0
+        if self.vectorized:
+            self.original_array = np.frombuffer(self.original_board, dtype=np.uint8).reshape(
+                self.size, self.size)
+        if profiler is not None:
+            profiler.instrument(self, GA_PHASES)
+
+    def parameters(self):
+        """Population settings for the current board size"""
+        if self.size <= 3:
+            return {"population_size": 20, "max_generations": 100, "mutation_rate": 0.3,
+                    "tournament_size": 2, "stagnation_limit": 10}
+        elif self.size <= 6:
+            return {"population_size": 100, "max_generations": 1000, "mutation_rate": 0.35,
+                    "tournament_size": 4, "stagnation_limit": 30}
+        return {"population_size": 150, "max_generations": 2000, "mutation_rate": 0.3,
+                "tournament_size": 5, "stagnation_limit": 50}
+
+    def start(self):
+        """Build and score the first population. On big boards that takes a while,
+        so a solve that runs out of time part-way starts from the gnomes so far"""
+        self.params = self.parameters()
+        gnomes = []
+        for _ in range(self.params["population_size"]):
+            gnomes.append(self.create_gnome_2d())
+            if self.control.over_budget():
+                break
+        self.population = self.rank(list(zip(gnomes, self.evaluate(gnomes))))
+
+        self.best_fitness = self.population[0][1]
+        self.best_solution_ever = self.population[0][0]
+        self.best_fitness_ever = self.best_fitness
+        self.stagnation_counter = 0
+
+    def step(self, inject_diversity=True):
+        """Evolve one generation: elitism, tournament selection, mating and,
+        when the run has stalled, an injection of fresh random gnomes"""
+        params = self.params
+        population_size = params["population_size"]
+        tournament_size = params["tournament_size"]
+        stagnation_limit = params["stagnation_limit"]
+        population = self.population
+
+        #keep the best solutions (elitism)
+        elite_count = max(2, self.size // 3)
+        new_population = population[:elite_count]
+
+        #fill the rest of the population with offspring
+        children = []
+        for _ in range(population_size - len(new_population)):
+            parent1 = self.select_parent(population, tournament_size)
+            parent2 = self.select_parent(population, tournament_size)
+            children.append(self.mate_2d(parent1, parent2, params["mutation_rate"]))
+            #a 25×25 generation can outlast a whole time budget, so cut it short once time is up
+            if self.control.over_budget():
+                break
+
+        population = self.rank(new_population + list(zip(children, self.evaluate(children))))
+
+        #check for improvement
+        if population[0][1] < self.best_fitness:
+            self.best_fitness = population[0][1]
+            self.stagnation_counter = 0
+            if population[0][1] < self.best_fitness_ever:
+                self.best_solution_ever = population[0][0]
+                self.best_fitness_ever = population[0][1]
+        else:
+            self.stagnation_counter += 1
+
+        #add diversity if stuck
+        if inject_diversity and self.stagnation_counter >= stagnation_limit // 2:
+            population = self.inject_diversity(population)
+            self.stagnation_counter = 0
+
+        self.population = population
+
+    def select_parent(self, population, tournament_size):
+        """Tournament selection: the fittest of a random sample of the population"""
+        tournament = self.rng.sample(population, min(tournament_size, len(population)))
+        tournament.sort(key=lambda x: x[1])
+        return tournament[0][0]
+
+    def rank(self, population):
+        """Sort (board, fitness) pairs best first, in place, and return them"""
+        population.sort(key=lambda x: x[1])
+        return population
+
+    def inject_diversity(self, population):
+        """Add a quarter population of fresh random gnomes and keep the best"""
+        population_size = self.params["population_size"]
+        gnomes = [self.create_gnome_2d() for _ in range(population_size // 4)]
+        population.extend(zip(gnomes, self.evaluate(gnomes)))
+        return self.rank(population)[:population_size]
+
+    def emigrants(self, count):
+        """Copies of the best 'count' boards, as plain bytes"""
+        return [bytes(board) for board, _ in self.population[:count]]
+
+    def adopt_board(self, board_2d):
+        """Turn a flat bytes board into this solver's chromosome type"""
+        return bytearray(board_2d)
+
+    def immigrate(self, boards):
+        """Replace the worst members of the population with 'boards'"""
+        if not boards:
+            return
+        boards = [self.adopt_board(board) for board in boards]
+        keep = self.population[:max(0, len(self.population) - len(boards))]
+        self.population = self.rank(keep + list(zip(boards, self.evaluate(boards))))
+        if self.population[0][1] < self.best_fitness_ever:
+            self.best_solution_ever = self.population[0][0]
+            self.best_fitness_ever = self.population[0][1]
+
+    def run(self, resume=None):
+        """Evolve until solved, stalled or out of generations, starting from a
+        checkpoint() state if 'resume' is given"""
+        stats = self.stats
+        if resume is None:
+            self.start()
+            first_generation = 1
+            stats.iterations = 1
+            perfect_solution_found = self.best_fitness == 0 and self.is_valid_solution_2d(self.population[0][0])
+        else:
+            self.restore(resume)
+            first_generation = resume["generation"] + 1
+            perfect_solution_found = resume["perfect_solution_found"]
+        max_generations = self.params["max_generations"]
+        stagnation_limit = self.params["stagnation_limit"]
+
+        stats.fitness = self.best_fitness
+        self.control.report(stats)
+
+        for generation in range(first_generation, max_generations + 1):
+            if self.control.should_stop():
+                self.control.checkpoint(stats, self.checkpoint(generation - 1, perfect_solution_found))
+                break
+
+            best_board, best_fitness = self.population[0]
+            stats.iterations = generation
+            stats.progress = min(99, (generation / max_generations) * 100)
+            stats.fitness = best_fitness
+
+            #report every 5 generations to keep the UI smooth
+            if generation % 5 == 0:
+                self.control.report(stats)
+
+            #check for stagnation
+            if self.stagnation_counter >= stagnation_limit:
+                if best_fitness <= self.size // 2:
+                    break
+
+            if not perfect_solution_found and best_fitness == 0 and self.is_valid_solution_2d(best_board):
+                perfect_solution_found = True
+                self.best_solution_ever = best_board
+                self.best_fitness_ever = best_fitness
+
+            #a valid solution can't be improved on, so don't spend more generations on it
+            if perfect_solution_found:
+                break
+
+            self.step()
+            if self.control.checkpoint_due():
+                self.control.checkpoint(stats, self.checkpoint(generation, perfect_solution_found))
+
+        stats.fitness = self.best_fitness_ever
+        return SudokuBoard(self.size, self.box_size_rows, self.box_size_cols, self.best_solution_ever)
+
+    def checkpoint(self, generation, perfect_solution_found=False):
+        """Everything run() needs to carry on after 'generation': the population
+        in rank order, the best-ever board, the counters and the RNG state"""
+        return {
+            "generation": generation,
+            "perfect_solution_found": perfect_solution_found,
+            "population": [encode_cells(board) for board, _ in self.population],
+            "best_solution_ever": encode_cells(self.best_solution_ever),
+            "best_fitness": self.best_fitness,
+            "best_fitness_ever": self.best_fitness_ever,
+            "stagnation_counter": self.stagnation_counter,
+            "rng": rng_state(self.rng),
+        }
+
+    def restore(self, state):
+        """Load a checkpoint() state in place of start()"""
+        self.params = self.parameters()
+        boards = [self.adopt_board(decode_cells(text)) for text in state["population"]]
+        self.population = list(zip(boards, self.evaluate(boards)))
+        self.best_solution_ever = self.adopt_board(decode_cells(state["best_solution_ever"]))
+        self.best_fitness = state["best_fitness"]
+        self.best_fitness_ever = state["best_fitness_ever"]
+        self.stagnation_counter = state["stagnation_counter"]
+        if self.rng is random:
+            self.rng = random.Random()  # don't rewind the shared module RNG
+        set_rng_state(self.rng, state["rng"])
+
+    def get_valid_numbers(self, board_2d, row, col):
+        return get_valid_numbers(board_2d, row, col, self.size, self.box_size_rows, self.box_size_cols)
+
+    def create_gnome_2d(self):
+        """Create a chromosome (candidate solution) starting from the puzzle"""
+        size = self.size
+        board_2d = bytearray(self.original_board)
+
+        #first try to fill easy cells that have only 1 valid number
+        progress = True
+        while progress:
+            progress = False
+            for index in range(size * size):
+                if board_2d[index] == 0:
+                    valid_numbers = self.get_valid_numbers(board_2d, *divmod(index, size))
+                    if len(valid_numbers) == 1:
+                        board_2d[index] = valid_numbers[0]
+                        progress = True
+
+        #fill the rest randomly but valid where possible
+        for index in range(size * size):
+            if board_2d[index] == 0:
+                valid_numbers = self.get_valid_numbers(board_2d, *divmod(index, size))
+                if valid_numbers:
+                    board_2d[index] = self.rng.choice(valid_numbers)
+                else:
+                    board_2d[index] = self.rng.randint(1, size)
+
+        return board_2d
+
+    def evaluate(self, boards):
+        """Fitness for a list of boards, in one vectorized pass when possible"""
+        if not boards:
+            return []
+        if self.vectorized:
+            population = np.frombuffer(b"".join(boards), dtype=np.uint8).reshape(
+                len(boards), self.size, self.size)
+            return population_fitness(population, self.original_array, self.box_size_rows,
+                                      self.box_size_cols, self.rows_fixed).tolist()
+        return [self.calculate_fitness_2d(board_2d) for board_2d in boards]
+
+    def calculate_fitness_2d(self, board_2d):
+        """Calculate fitness score for a flat board (lower = better)"""
+        #penalize empty cells
+        fitness = 10 * board_2d.count(0)
+
+        #check rows, columns and boxes for duplicates
+        for unit in unit_table(self.size, self.box_size_rows, self.box_size_cols):
+            values = [board_2d[index] for index in unit if board_2d[index] != 0]
+            fitness += len(values) - len(set(values))
+
+        #penalize changes to original cells
+        for given, value in zip(self.original_board, board_2d):
+            if given != 0 and value != given:
+                fitness += 5
+
+        return fitness
+
+    def mate_2d(self, parent1, parent2, mutation_rate=0.2):
+        """Combine two parent solutions to create a child solution"""
+        rng = self.rng
+        size = self.size
+        child = bytearray(self.original_board)
+
+        for index in range(size * size):
+            if child[index] == 0:  # skip cells that already have original clues
+                if rng.random() < mutation_rate:
+                    valid_numbers = self.get_valid_numbers(child, *divmod(index, size))
+                    if valid_numbers:
+                        child[index] = rng.choice(valid_numbers)
+                        continue
+                #choose from parents (never allow zeros)
+                p1_val = parent1[index] if parent1[index] != 0 else rng.randint(1, size)
+                p2_val = parent2[index] if parent2[index] != 0 else rng.randint(1, size)
+                child[index] = p1_val if rng.random() < 0.5 else p2_val
+
+        return child
+
+    def is_valid_solution_2d(self, board_2d):
+        return is_valid_solution(board_2d, self.size, self.box_size_rows, self.box_size_cols)
+
+
+class CountedBoard(bytearray):
+    """A chromosome (flat bytearray) that also carries its column and box digit
+    counts and its duplicate total, so a changed cell updates fitness in O(1)"""
+
+    __slots__ = ("col_counts", "box_counts", "fitness")
+
+
+class PermutationGeneticSolver(GeneticSolver):
+    """Genetic algorithm whose rows are always permutations of 1..size that keep
+    the clues in place. Crossover swaps whole rows and mutation swaps two non-clue
+    cells of a row, so rows never conflict and fitness only counts column and box
+    duplicates.
+
+    With incremental (the default) each chromosome is a CountedBoard: children
+    start from parent1's count tables and only the cells that differ are
+    re-counted, instead of rescanning all size² cells per child.
+    """
+
+    rows_fixed = True
+
+    def __init__(self, board, stats, control, rng=None, vectorized=True, incremental=True, profiler=None):
+        super().__init__(board, stats, control, rng, vectorized, profiler)
+        self.incremental = incremental
+        size = self.size
+        #per row: the flat indices we may change and the digits the clues leave over
+        self.free_cells = []
+        self.missing = []
+        for row in range(size):
+            values = self.original_board[row * size:(row + 1) * size]
+            self.free_cells.append([row * size + c for c, value in enumerate(values) if value == 0])
+            self.missing.append([n for n in range(1, size + 1) if n not in values])
+        self.mutable_rows = [r for r, cells in enumerate(self.free_cells) if len(cells) >= 2]
+        #count tables are flat: counts[unit * (size + 1) + digit]
+        self.box_of = box_table(size, self.box_size_rows, self.box_size_cols)
+        self.box_count = self.box_of[-1] + 1
+
+    def count_board(self, board_2d):
+        """Wrap board_2d in a CountedBoard with freshly built count tables"""
+        stride = self.size + 1
+        counted = CountedBoard(board_2d)
+        counted.col_counts = bytearray(self.size * stride)
+        counted.box_counts = bytearray(self.box_count * stride)
+        counted.fitness = 0
+        for index, digit in enumerate(board_2d):
+            self.add_digit(counted, index, digit)
+        return counted
+
+    def add_digit(self, board, index, digit):
+        stride = self.size + 1
+        col_slot = (index % self.size) * stride + digit
+        box_slot = self.box_of[index] * stride + digit
+        if board.col_counts[col_slot]:
+            board.fitness += 1
+        board.col_counts[col_slot] += 1
+        if board.box_counts[box_slot]:
+            board.fitness += 1
+        board.box_counts[box_slot] += 1
+
+    def remove_digit(self, board, index, digit):
+        stride = self.size + 1
+        col_slot = (index % self.size) * stride + digit
+        box_slot = self.box_of[index] * stride + digit
+        board.col_counts[col_slot] -= 1
+        if board.col_counts[col_slot]:
+            board.fitness -= 1
+        board.box_counts[box_slot] -= 1
+        if board.box_counts[box_slot]:
+            board.fitness -= 1
+
+    def create_gnome_2d(self):
+        """Fill each row with its missing digits, avoiding column/box clashes where possible"""
+        size = self.size
+        board_2d = bytearray(self.original_board)
+        for row in range(size):
+            digits = self.missing[row][:]
+            self.rng.shuffle(digits)
+            for index in self.free_cells[row]:
+                valid = set(self.get_valid_numbers(board_2d, row, index % size))
+                pick = next((d for d in digits if d in valid), digits[0])
+                digits.remove(pick)
+                board_2d[index] = pick
+        return self.count_board(board_2d) if self.incremental else board_2d
+
+    def mate_2d(self, parent1, parent2, mutation_rate=0.2):
+        """Row-wise uniform crossover, then swap mutations inside rows"""
+        if self.incremental:
+            return self.mate_counted(parent1, parent2, mutation_rate)
+
+        rng = self.rng
+        size = self.size
+        child = bytearray()
+        for row in range(size):
+            child += (parent1 if rng.random() < 0.5 else parent2)[row * size:(row + 1) * size]
+
+        for row in self.mutable_rows:
+            if rng.random() < mutation_rate / 2:
+                a, b = rng.sample(self.free_cells[row], 2)
+                child[a], child[b] = child[b], child[a]
+
+        return child
+
+    def mate_counted(self, parent1, parent2, mutation_rate):
+        """mate_2d for CountedBoards: copy parent1's tables, then apply deltas"""
+        rng = self.rng
+        size = self.size
+        child = CountedBoard(parent1)
+        child.col_counts = parent1.col_counts[:]
+        child.box_counts = parent1.box_counts[:]
+        child.fitness = parent1.fitness
+
+        for row in range(size):
+            if rng.random() >= 0.5:
+                start = row * size
+                if child[start:start + size] != parent2[start:start + size]:
+                    for index in self.free_cells[row]:
+                        if child[index] != parent2[index]:
+                            self.remove_digit(child, index, child[index])
+                            self.add_digit(child, index, parent2[index])
+                            child[index] = parent2[index]
+
+        for row in self.mutable_rows:
+            if rng.random() < mutation_rate / 2:
+                a, b = rng.sample(self.free_cells[row], 2)
+                digit_a, digit_b = child[a], child[b]
+                self.remove_digit(child, a, digit_a)
+                self.remove_digit(child, b, digit_b)
+                self.add_digit(child, a, digit_b)
+                self.add_digit(child, b, digit_a)
+                child[a], child[b] = digit_b, digit_a
+
+        return child
+
+    def adopt_board(self, board_2d):
+        board_2d = bytearray(board_2d)
+        return self.count_board(board_2d) if self.incremental else board_2d
+
+    def evaluate(self, boards):
+        if self.incremental:
+            return [board.fitness for board in boards]
+        return super().evaluate(boards)
+
+    def calculate_fitness_2d(self, board_2d):
+        """Count column and box duplicates (rows are valid by construction)"""
+        units = unit_table(self.size, self.box_size_rows, self.box_size_cols)[self.size:]
+        return sum(len(unit) - len({board_2d[index] for index in unit}) for unit in units)
+
+
+def solve_genetic(board, stats, control, rng=None, profiler=None, resume=None):
+    """Run the genetic algorithm. Always returns its best board, solved or not"""
+    return GeneticSolver(board, stats, control, rng, profiler=profiler).run(resume)
+
+
+def solve_permutation_genetic(board, stats, control, rng=None, profiler=None, resume=None):
+    """Run the row-permutation genetic algorithm. Always returns its best board"""
+    return PermutationGeneticSolver(board, stats, control, rng, profiler=profiler).run(resume)
+
+
+#chromosome encodings an island can run
+ISLAND_SOLVERS = {
+    "genetic": GeneticSolver,
+    "permutation": PermutationGeneticSolver,
+}
+
+
+def _run_island(index, puzzle, island_algorithm, seed, migration_interval, migrants,
+                topology, inboxes, results, stop_event, time_budget=None, iteration_budget=None):
+    """Body of one island process: evolve, and every migration_interval
+    generations send the best boards to a neighbour and take in any arrivals.
+    Every new best board is reported, so the parent always has one to return"""
+    rng = random.Random(seed)
+    stats = SolveStats()
+    control = SolverControl(memory="none", time_budget=time_budget, iteration_budget=iteration_budget)
+    control.begin(stats)
+    solver = ISLAND_SOLVERS[island_algorithm](puzzle, stats, control, rng)
+    solver.start()
+    max_generations = solver.params["max_generations"]
+    others = [i for i in range(len(inboxes)) if i != index]
+
+    generation = 0
+    reported = solver.best_fitness_ever
+    results.put(("progress", index, generation, reported, bytes(solver.best_solution_ever)))
+    while generation < max_generations and solver.best_fitness_ever > 0 \
+            and not stop_event.is_set() and not control.should_stop():
+        generation += 1
+        stats.iterations = generation
+        #migration replaces the random-gnome reset as the source of diversity
+        solver.step(inject_diversity=False)
+        if solver.best_fitness_ever < reported:
+            reported = solver.best_fitness_ever
+            results.put(("progress", index, generation, reported, bytes(solver.best_solution_ever)))
+
+        if generation % migration_interval == 0 and others:
+            target = (index + 1) % len(inboxes) if topology == "ring" else rng.choice(others)
+            inboxes[target].put(solver.emigrants(migrants))
+            arrivals = []
+            while True:
+                try:
+                    arrivals.extend(inboxes[index].get_nowait())
+                except queue.Empty:
+                    break
+            solver.immigrate(arrivals)
+
+    if solver.best_fitness_ever == 0:
+        stop_event.set()  # tell the other islands a solution exists
+    #migrants nobody will read must not keep this process alive at exit
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+    best = bytes(solver.best_solution_ever)
+    results.put(("done", index, generation, solver.best_fitness_ever, best))
+
+
+def solve_islands(board, stats, control, islands=None, migration_interval=10, migrants=2,
+                  topology="ring", island_algorithm="permutation", seed=None):
+    """Island-model GA: 'islands' sub-populations evolve in separate processes and
+    every migration_interval generations each one sends its best 'migrants' boards
+    to a neighbour (topology "ring") or to a random island ("random").
+    Returns the best board found by any island, solved or not.
+
+    Each island gets what is left of the control's time budget and its
+    iteration budget (in generations). Islands still running at the deadline,
+    e.g. ones still starting up or building their first population, are
+    terminated and the best board reported so far is returned (or, if none
+    has been yet, a first gnome built in this process)."""
+    islands = islands or os.cpu_count() or 1
+    seed = seed if seed is not None else random.randrange(1 << 30)
+    #spawn, not fork: the caller may be a threaded Tk process
+    context = multiprocessing.get_context("spawn")
+    inboxes = [context.Queue() for _ in range(islands)]
+    results = context.Queue()
+    stop_event = context.Event()
+
+    workers = [context.Process(target=_run_island,
+                               args=(i, board, island_algorithm, seed + i, migration_interval,
+                                     migrants, topology, inboxes, results, stop_event,
+                                     control.remaining_time(), control.iteration_budget),
+                               daemon=True)
+               for i in range(islands)]
+    for worker in workers:
+        worker.start()
+
+    generations = [0] * islands
+    best_board, best_fitness = None, None
+    finished = 0
+    while finished < islands:
+        if control.over_budget():
+            #out of budget: keep what has been reported and stop the stragglers
+            stop_event.set()
+            for worker in workers:
+                worker.terminate()
+            break
+        if control.should_stop():
+            stop_event.set()
+        remaining = control.remaining_time()
+        try:
+            message = results.get(timeout=0.1 if remaining is None else min(0.1, remaining + 0.001))
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers) and results.empty():
+                break  # an island died without reporting
+            continue
+
+        kind, index, generation, fitness, best = message
+        generations[index] = generation
+        if kind == "done":
+            finished += 1
+        if best_fitness is None or fitness < best_fitness:
+            best_board, best_fitness = best, fitness
+        stats.iterations = max(generations)
+        stats.fitness = best_fitness
+        control.report(stats)
+
+    for worker in workers:
+        worker.join(1)
+    if best_board is None and control.over_budget():
+        #no island got a board out before the deadline (starting a process takes
+        #a while), so build one here: out of budget, start() stops at one gnome
+        solver = ISLAND_SOLVERS[island_algorithm](board, stats, control, random.Random(seed))
+        solver.start()
+        best_board, best_fitness = bytes(solver.best_solution_ever), solver.best_fitness_ever
+    if best_board is None:
+        return None
+    stats.fitness = best_fitness
+    return SudokuBoard(board.size, board.box_size_rows, board.box_size_cols, best_board)
+
+
+#search nodes each repair attempt of the hybrid solver may spend
+REPAIR_NODE_LIMIT = 20000
+
+
+def solve_hybrid(board, stats, control, rng=None, profiler=None, genetic="permutation",
+                 repair_nodes=REPAIR_NODE_LIMIT):
+    """GA for diversity, exact search for correctness.
+
+    The 'genetic' solver (an ISLAND_SOLVERS name) evolves until its best board
+    has not improved for stagnation_limit generations. The cells of that board
+    that clash with nothing are then kept as hints, and the MRV search fills in
+    the conflicted cells around them. If the hints admit no solution within
+    'repair_nodes' nodes, the region is widened to the rows, columns and boxes
+    of the conflicts, and finally to every cell but the clues, which is a plain
+    MRV solve limited only by the control's budget. Returns the first solution
+    found, or the GA's best board if the puzzle has none or the solve was
+    stopped. stats.iterations counts generations plus repair nodes.
+    """
+    size = board.size
+    solver = ISLAND_SOLVERS[genetic](board, stats, control, rng, profiler=profiler)
+    solver.start()
+    params = solver.params
+    generation = last_improvement = stats.iterations = 1
+    best_fitness = stats.fitness = solver.best_fitness_ever
+    control.report(stats)
+
+    while best_fitness > 0 and generation < params["max_generations"] \
+            and generation - last_improvement < params["stagnation_limit"] and not control.should_stop():
+        solver.step()
+        generation += 1
+        stats.iterations = generation
+        if solver.best_fitness_ever < best_fitness:
+            best_fitness, last_improvement = solver.best_fitness_ever, generation
+        stats.fitness = best_fitness
+        if generation % 5 == 0:
+            stats.progress = min(99, generation / params["max_generations"] * 100)
+            control.report(stats)
+
+    best = SudokuBoard(size, board.box_size_rows, board.box_size_cols, solver.best_solution_ever)
+    if best.is_valid_solution():
+        return best
+
+    peers = peer_table(size, board.box_size_rows, board.box_size_cols)
+    conflicted = {row * size + col for row, col in best.find_invalid_cells()}
+    widened = conflicted.union(*(peers[index] for index in conflicted))
+    for region in (conflicted, widened, None):
+        if control.should_stop():
+            break
+        attempt = board.copy()
+        if region is not None:
+            for index, digit in enumerate(best.cells):
+                if index not in region:
+                    attempt.cells[index] = digit
+        grid = BitmaskGrid(attempt)
+        if not grid.consistent:
+            continue
+        solutions = mrv_search(grid, 1, stats, control, None if region is None else repair_nodes)
+        if solutions:
+            stats.fitness = 0
+            return SudokuBoard(size, board.box_size_rows, board.box_size_cols, solutions[0])
+    return best
+
+
+#registered solvers, keyed by the algorithm name the GUI and batch tools use
+SOLVERS: Dict[str, Callable] = {
+    "backtracking": solve_backtracking,
+    "bitmask": solve_bitmask,
+    "mrv": solve_mrv,
+    "dlx": solve_dlx,
+    "genetic": solve_genetic,
+    "permutation": solve_permutation_genetic,
+    "islands": solve_islands,
+    "hybrid": solve_hybrid,
+}
+
+
+#solvers that can write checkpoints and carry on from one
+RESUMABLE = {"backtracking", "bitmask", "mrv", "genetic", "permutation"}
+
+
+def solve(puzzle, algorithm="backtracking", control=None, resume=None, **options):
+    """Solve 'puzzle' (a SudokuBoard) with the named algorithm and return a SolveResult.
+
+    'resume' is a checkpoint dict (see read_checkpoint) to continue from
+    instead of starting over; resume_solve() builds the puzzle for you.
+    Give control a time_budget or iteration_budget for an anytime solve: the
+    result comes back within about one stop check of the budget (a few ms),
+    with the best board so far.
+    """
+    if algorithm not in SOLVERS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {sorted(SOLVERS)}")
+    if resume is not None and algorithm not in RESUMABLE:
+        raise ValueError(f"{algorithm!r} cannot resume from a checkpoint")
+    if control is None:
+        control = SolverControl()
+
+    stats = SolveStats()
+    control.begin(stats, algorithm, puzzle)
+    if resume is not None:
+        stats.iterations = resume["iterations"]
+        stats.start_time -= resume["elapsed_time"]
+        options["resume"] = resume["state"]
+    try:
+        board = SOLVERS[algorithm](puzzle, stats, control, **options)
+    finally:
+        control.finish(stats)
+    stats.iterations = max(stats.iterations, 1)
+
+    solved = board is not None and board.is_valid_solution() and board.matches_clues(puzzle)
+    if solved:
+        stats.progress = 100
+        status = "proven"
+    else:
+        status = "timeout" if control.expired else "partial"
+    return SolveResult(board, solved, stats, algorithm, status)
+
+
+def resume_solve(checkpoint, control=None):
+    """Carry on the solve a checkpoint dict was written from, on any machine"""
+    puzzle = SudokuBoard.from_flat(checkpoint["puzzle"], *checkpoint["layout"])
+    return solve(puzzle, checkpoint["algorithm"], control, checkpoint)
+
+
+def fill_box(board, start_row, start_col, size, box_size_rows, box_size_cols, rng=random):
+    """Fill a box of the SudokuBoard 'board' with random numbers"""
+    nums = list(range(1, size + 1))
+    rng.shuffle(nums)
+
+    for i in range(box_size_rows):
+        for j in range(box_size_cols):
+            if start_row + i < size and start_col + j < size:
+                board[start_row + i, start_col + j] = nums.pop()
+
+
+def random_solution(size, box_size_rows, box_size_cols, rng=random):
+    """A random complete board for the layout.
+
+    When the boxes tile the board this shuffles a fixed pattern (bands, rows
+    within bands, stacks, columns within stacks and digit labels), which is
+    instant even at 25×25. Other layouts fill the diagonal boxes and complete
+    the grid with the MRV search.
+    """
+    if box_size_rows * box_size_cols == size:
+        def shuffled(groups, group_size):
+            order = []
+            for group in rng.sample(range(groups), groups):
+                order.extend(group * group_size + i for i in rng.sample(range(group_size), group_size))
+            return order
+
+        rows = shuffled(size // box_size_rows, box_size_rows)
+        cols = shuffled(size // box_size_cols, box_size_cols)
+        digits = rng.sample(range(1, size + 1), size)
+        cells = bytes(digits[(box_size_cols * (r % box_size_rows) + r // box_size_rows + c) % size]
+                      for r in rows for c in cols)
+        return SudokuBoard(size, box_size_rows, box_size_cols, cells)
+
+    while True:
+        board = SudokuBoard(size, box_size_rows, box_size_cols)
+
+        #filling diagonal boxes first (these can be filled independently)
+        for i in range(0, size, max(box_size_rows, box_size_cols)):
+            if i + box_size_rows <= size and i + box_size_cols <= size:
+                fill_box(board, i, i, size, box_size_rows, box_size_cols, rng)
+
+        #fill the rest with the MRV search; some diagonals cannot be
+        #completed, so start over with a new one
+        grid = BitmaskGrid(board)
+        solutions = mrv_search(grid, 1)
+        if solutions:
+            grid.cells = solutions[0]
+            return grid.to_board(board)
+
+
+def generate_puzzle(size=9, box_size_rows=None, box_size_cols=None, rng=None, unique=True,
+                    remove_fraction=0.6):
+    """Generate a (puzzle, solution) pair of SudokuBoards.
+
+    Clues are removed one at a time in random order, up to remove_fraction of
+    the cells (60% by default). With unique (the default) a removal is only
+    kept if has_other_solution() proves there is still exactly one solution,
+    so 'solution' is the only valid answer. On 25×25 that proof often runs
+    out of budget, so those puzzles keep somewhat more clues (about 275 of
+    625).
+    """
+    rng = rng if rng is not None else random
+    if box_size_rows is None or box_size_cols is None:
+        box_size_rows, box_size_cols = BOX_SIZES[size]
+    solution = random_solution(size, box_size_rows, box_size_cols, rng)
+
+    cells_to_remove = int(size * size * remove_fraction)
+    positions = list(range(size * size))
+    rng.shuffle(positions)
+    puzzle = solution.copy()
+    removed = 0
+    for index in positions:
+        if removed >= cells_to_remove:
+            break
+        value = puzzle.apply(index, 0)
+        if unique and has_other_solution(puzzle, index, value, GENERATOR_NODE_LIMIT) is not False:
+            puzzle.undo(index, value)  # this clue is needed to keep the answer unique
+        else:
+            removed += 1
+
+    return puzzle, solution
+
+
+def _generate_puzzles(seed, requests, results):
+    """Body of the PuzzlePool's generator process: answer every layout sent in
+    with a (layout, (puzzle, solution)) pair until None arrives"""
+    rng = random.Random(seed)
+    for layout in iter(requests.get, None):
+        results.put((layout, generate_puzzle(*layout, rng=rng)))
+
+
+class PuzzlePool:
+    """Ready-made (puzzle, solution) pairs per board layout, so a new game never
+    waits on the generator.
+
+    A background thread tops a layout's pool up to its high water mark whenever
+    it drops below low_water, smallest boards first and any layout that has
+    run dry before the rest. The puzzles themselves are generated in a
+    separate process, so a long refill never holds the GIL against a solver
+    being timed in this one; pause() holds refills back altogether, for when
+    that solver should not share the CPU either. Boards above 9×9 take from a second to ~20 s of
+    CPU each, so only big_high_water of them are kept warm. take() is O(1)
+    while the pool has puzzles; when it has run dry it generates inline, or
+    with wait=False returns None at once so a UI can show that it is
+    generating and ask again later.
+    """
+
+    def __init__(self, layouts=None, low_water=2, high_water=8, big_high_water=1):
+        if layouts is None:
+            layouts = [(size,) + box for size, box in BOX_SIZES.items()]
+        self.low_water = low_water
+        self.high_water = high_water
+        self.big_high_water = big_high_water
+        self.rng = random.Random()
+        self._pools = {layout: collections.deque() for layout in layouts}
+        self._filling = set(self._pools)  # layouts being topped up to their high water mark
+        self._condition = threading.Condition()
+        self._closed = False
+        self._paused = False
+        #spawn, not fork: the caller may be a threaded Tk process
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(target=_generate_puzzles, name="puzzle-generator", daemon=True,
+                                        args=(self.rng.randrange(1 << 30), self._requests, self._results))
+        self._process.start()
+        self._thread = threading.Thread(target=self._refill_loop, name="puzzle-pool", daemon=True)
+        self._thread.start()
+
+    def _marks(self, layout):
+        """(low, high) water marks of a layout"""
+        high = self.high_water if layout[0] <= 9 else self.big_high_water
+        return min(self.low_water, high), high
+
+    def take(self, size=9, box_size_rows=None, box_size_cols=None, wait=True):
+        """Return a (puzzle, solution) pair for the layout, or None if the pool is
+        empty and 'wait' is false"""
+        if box_size_rows is None or box_size_cols is None:
+            box_size_rows, box_size_cols = BOX_SIZES[size]
+        layout = (size, box_size_rows, box_size_cols)
+        with self._condition:
+            pool = self._pools.setdefault(layout, collections.deque())
+            item = pool.popleft() if pool else None
+            if len(pool) < self._marks(layout)[0] and layout not in self._filling:
+                self._filling.add(layout)
+                self._condition.notify()
+        if item is None and wait:
+            item = generate_puzzle(size, box_size_rows, box_size_cols, random.Random())
+        return item
+
+    def available(self, size, box_size_rows, box_size_cols):
+        with self._condition:
+            return len(self._pools.get((size, box_size_rows, box_size_cols), ()))
+
+    def pause(self):
+        """Start no new puzzles until resume(); with psutil installed the one
+        being generated is suspended as well"""
+        with self._condition:
+            if self._paused:
+                return
+            self._paused = True
+        self._signal_generator("suspend")
+
+    def resume(self):
+        with self._condition:
+            if not self._paused:
+                return
+            self._paused = False
+            self._condition.notify()
+        self._signal_generator("resume")
+
+    def _signal_generator(self, action):
+        if psutil is None:
+            return
+        try:
+            getattr(psutil.Process(self._process.pid), action)()
+        except psutil.Error:
+            pass  # already gone
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._signal_generator("resume")  # a suspended process could not read the None
+        self._requests.put(None)
+
+    def _refill_loop(self):
+        while True:
+            with self._condition:
+                while (not self._filling or self._paused) and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                #a layout someone is waiting on first, then the quick small boards
+                layout = min(self._filling, key=lambda layout: (len(self._pools[layout]) > 0, layout))
+
+            #wait outside the lock so take() is never blocked by it
+            self._requests.put(layout)
+            try:
+                layout, item = self._results.get()
+            except (EOFError, OSError):
+                return  # the generator process is gone; take() still generates inline
+
+            with self._condition:
+                pool = self._pools[layout]
+                pool.append(item)
+                if len(pool) >= self._marks(layout)[1]:
+                    self._filling.discard(layout)
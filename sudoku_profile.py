@@ -0,0 +1,46 @@
+"""Profile where a genetic solver spends its time, phase by phase.
+
+Runs one GA solve with a PhaseProfiler attached and prints a table of time
+and call counts for initialization, selection, mating, fitness, sorting and
+diversity injection. The same data can be saved as JSON (including a
+per-generation breakdown) or as folded stacks for flamegraph.pl/speedscope.
+
+    python sudoku_profile.py -a permutation -s 9 --seed 1
+    python sudoku_profile.py -a genetic --json ga.json --folded ga.folded
+"""
+import argparse
+import json
+import random
+import sys
+
+from sudoku_engine import BOX_SIZES, ISLAND_SOLVERS, PhaseProfiler, SolverControl, generate_puzzle, solve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-phase profile of one genetic solve.")
+    parser.add_argument("-a", "--algorithm", default="genetic", choices=sorted(ISLAND_SOLVERS))
+    parser.add_argument("-s", "--size", type=int, default=9, choices=sorted(BOX_SIZES))
+    parser.add_argument("--seed", type=int, default=0, help="seeds both the puzzle and the solver")
+    parser.add_argument("--json", help="write totals and the per-generation breakdown here")
+    parser.add_argument("--folded", help="write folded stacks (self time in microseconds) here")
+    args = parser.parse_args(argv)
+
+    puzzle, _ = generate_puzzle(args.size, rng=random.Random(args.seed))
+    profiler = PhaseProfiler()
+    result = solve(puzzle, args.algorithm, SolverControl(memory="none"),
+                   rng=random.Random(args.seed), profiler=profiler)
+
+    print(profiler.summary())
+    print(f"\nsolved={result.solved} fitness={result.stats.fitness} "
+          f"generations={result.stats.iterations} elapsed={result.stats.elapsed_time:.2f}s")
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump(profiler.to_dict(), out, indent=2)
+    if args.folded:
+        with open(args.folded, "w") as out:
+            out.write(profiler.folded())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Regression tests for the engine's correctness claims: checkpoint resume,
+vectorized and incremental fitness, solution counts and the conflict index.
+
+    python -m pytest -q
+"""
+import random
+
+import pytest
+
+from sudoku_engine import (RESUMABLE, ConflictIndex, GeneticSolver, PermutationGeneticSolver, SolverControl,
+                           SolveStats, SudokuBoard, build_exact_cover, count_solutions, find_invalid_cells,
+                           generate_puzzle, read_checkpoint, resume_solve, solve)
+
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+#per resumable solver: a puzzle it does not finish at once, where to stop it,
+#and an iteration budget for the genetic ones (which may never finish at all)
+RESUME_CASES = {
+    "backtracking": (HARD, 20000, None),
+    "bitmask": (HARD, 20000, None),
+    "mrv": (HARD, 500, None),
+    "genetic": (1, 10, 30),
+    "permutation": (0, 10, 30),
+}
+
+
+def resume_case(algorithm):
+    puzzle, stop_at, budget = RESUME_CASES[algorithm]
+    if isinstance(puzzle, int):
+        puzzle = generate_puzzle(9, rng=random.Random(puzzle))[0]
+    else:
+        puzzle = SudokuBoard.from_flat(puzzle)
+    return puzzle, stop_at, budget
+
+
+def test_every_resumable_solver_has_a_case():
+    assert set(RESUME_CASES) == RESUMABLE
+
+
+@pytest.mark.parametrize("algorithm", sorted(RESUMABLE))
+def test_stopped_run_resumes_to_the_uninterrupted_result(algorithm, tmp_path):
+    puzzle, stop_at, budget = resume_case(algorithm)
+    path = str(tmp_path / "run.ckpt.gz")
+
+    def options():
+        #both runs draw from the same seed; the resumed one restores the RNG state
+        return {"rng": random.Random(9)} if algorithm in ("genetic", "permutation") else {}
+
+    full = solve(puzzle, algorithm, SolverControl(memory="none", iteration_budget=budget), **options())
+
+    def stop_when_due(stats):
+        if stats.iterations >= stop_at:
+            control.stop()
+
+    control = SolverControl(on_progress=stop_when_due, memory="none", checkpoint_path=path,
+                            checkpoint_interval=1e9, iteration_budget=budget)
+    solve(puzzle, algorithm, control, **options())
+    checkpoint = read_checkpoint(path)
+    assert stop_at <= checkpoint["iterations"] < full.stats.iterations
+
+    resumed = resume_solve(checkpoint, SolverControl(memory="none", iteration_budget=budget))
+    assert resumed.board == full.board
+    assert resumed.stats.iterations == full.stats.iterations
+    assert resumed.solved == full.solved
+
+
+def random_boards(solver, count, rng):
+    """Gnomes plus boards with random digits and holes, scored both ways below"""
+    size = solver.size
+    boards = [bytearray(solver.create_gnome_2d()) for _ in range(count)]
+    for board in boards[count // 2:]:
+        for index in rng.sample(range(size * size), size):
+            board[index] = rng.randint(0, size)
+    return [bytes(board) for board in boards]
+
+
+@pytest.mark.parametrize("size", [6, 9, 12])
+def test_population_fitness_matches_calculate_fitness_2d(size):
+    pytest.importorskip("numpy")
+    rng = random.Random(size)
+    puzzle = generate_puzzle(size, rng=rng)[0]
+    solver = GeneticSolver(puzzle, SolveStats(), SolverControl(memory="none"), rng)
+    assert solver.vectorized
+    boards = random_boards(solver, 40, rng)
+    assert solver.evaluate(boards) == [solver.calculate_fitness_2d(board) for board in boards]
+
+
+@pytest.mark.parametrize("size", [6, 9, 12])
+def test_rows_fixed_population_fitness_matches_calculate_fitness_2d(size):
+    pytest.importorskip("numpy")
+    rng = random.Random(size)
+    puzzle = generate_puzzle(size, rng=rng)[0]
+    solver = PermutationGeneticSolver(puzzle, SolveStats(), SolverControl(memory="none"), rng, incremental=False)
+    assert solver.vectorized
+    boards = [bytes(solver.create_gnome_2d()) for _ in range(40)]
+    assert solver.evaluate(boards) == [solver.calculate_fitness_2d(board) for board in boards]
+
+
+@pytest.mark.parametrize("size", [6, 9, 12])
+def test_mate_counted_keeps_fitness_in_step_with_a_recount(size):
+    rng = random.Random(size)
+    puzzle = generate_puzzle(size, rng=rng)[0]
+    solver = PermutationGeneticSolver(puzzle, SolveStats(), SolverControl(memory="none"), rng)
+    population = [solver.create_gnome_2d() for _ in range(10)]
+    for _ in range(200):
+        parent1, parent2 = rng.sample(population, 2)
+        child = solver.mate_counted(parent1, parent2, mutation_rate=0.6)
+        recount = solver.count_board(bytearray(child))
+        assert child.fitness == recount.fitness == solver.calculate_fitness_2d(child)
+        assert child.col_counts == recount.col_counts and child.box_counts == recount.box_counts
+        population[rng.randrange(len(population))] = child
+
+
+#(size, box rows, box cols, clues) -> number of solutions
+KNOWN_COUNTS = [
+    ((3, 1, 1, ""), 12),  # Latin squares of order 3
+    ((4, 2, 2, ""), 288),
+    ((4, 2, 2, "1234"), 12),
+    ((9, 3, 3, HARD), 1),
+    ((9, 3, 3, "11"), 0),
+]
+
+
+def known_board(size, box_size_rows, box_size_cols, clues):
+    return SudokuBoard.from_flat(clues.ljust(size * size, "0"), size, box_size_rows, box_size_cols)
+
+
+@pytest.mark.parametrize("layout, expected", KNOWN_COUNTS)
+def test_count_solutions_on_known_counts(layout, expected):
+    assert count_solutions(known_board(*layout), limit=1000) == expected
+
+
+@pytest.mark.parametrize("layout, expected", KNOWN_COUNTS)
+def test_dlx_on_known_counts(layout, expected):
+    links, _ = build_exact_cover(known_board(*layout))
+    if links is None:
+        assert expected == 0
+        return
+    solutions, partial = links.search(1000)
+    assert len(solutions) == expected and partial is None
+
+
+@pytest.mark.parametrize("size", [6, 9, 12, 16])
+def test_conflict_index_matches_find_invalid_cells(size):
+    rng = random.Random(size)
+    puzzle = generate_puzzle(size, rng=rng)[0]
+    index = ConflictIndex(puzzle)
+    cells = bytearray(puzzle.cells)
+    assert index.conflicts == find_invalid_cells(cells, size, puzzle.box_size_rows, puzzle.box_size_cols)
+    for _ in range(500):
+        row, col, digit = rng.randrange(size), rng.randrange(size), rng.randint(0, size)
+        index.set(row, col, digit)
+        cells[row * size + col] = digit
+        assert index.conflicts == find_invalid_cells(cells, size, puzzle.box_size_rows, puzzle.box_size_cols)